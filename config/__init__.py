@@ -31,6 +31,9 @@ class ConfigurationManager:
     _instance: Optional['ConfigurationManager'] = None
     _config: Dict[str, Any] = {}
     
+    # Marks keys known to be absent in the lookup cache
+    _MISSING = object()
+    
     def __new__(cls, config_path: Optional[str] = None) -> 'ConfigurationManager':
         """
         Singleton pattern to ensure only one configuration instance exists.
@@ -84,6 +87,9 @@ class ConfigurationManager:
         with open(self.config_path, 'r', encoding='utf-8') as f:
             self._config = yaml.safe_load(f)
         
+        # Resolved dot-notation lookups; rebuilt on every (re)load
+        self._cache: Dict[str, Any] = {}
+        
         # Resolve relative paths to absolute paths
         self._resolve_paths()
     
@@ -116,15 +122,31 @@ class ConfigurationManager:
             >>> config.get("nonexistent.key", "default_value")
             "default_value"
         """
-        keys = key.split('.')
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._lookup(key)
+        
+        return default if value is self._MISSING else value
+    
+    def _lookup(self, key: str) -> Any:
+        """
+        Walk the configuration tree for a dot-notation key.
+        
+        Args:
+            key: Configuration key in dot notation.
+            
+        Returns:
+            Configuration value, or _MISSING if the key doesn't exist.
+        """
         value = self._config
         
         try:
-            for k in keys:
+            for k in key.split('.'):
                 value = value[k]
             return value
         except (KeyError, TypeError):
-            return default
+            return self._MISSING
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -163,7 +185,8 @@ def get_config(key: str, default: Any = None) -> Any:
     Returns:
         Configuration value or default.
     """
-    return ConfigurationManager().get(key, default)
+    manager = ConfigurationManager._instance or ConfigurationManager()
+    return manager.get(key, default)
 
 
 # Export public API
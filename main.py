@@ -236,7 +236,7 @@ def run_extraction(
     # Import pipeline components
     from src.input_handler import InputHandler
     from src.ocr_engine import OCREngine
-    from src.model_inference import InvoiceExtractor
+    from src.model_inference import InvoiceExtractor, ExtractionResult
     from src.postprocessor import PostProcessor
     from src.output_handler import OutputHandler
     
@@ -269,45 +269,53 @@ def run_extraction(
     # Process each file through the pipeline
     extraction_results = []
     
-    for file_path in files_to_process:
-        logger.info(f"Processing: {file_path.name}")
-        
-        try:
-            # Phase 1: Input handling - load and normalize document
-            document = input_handler.load(str(file_path))
-            
-            # Process each page (for multi-page documents)
-            images = document.images if hasattr(document, 'images') else []
+    try:
+        for file_path in files_to_process:
+            logger.info(f"Processing: {file_path.name}")
             
-            for page_idx, image in enumerate(images):
-                if image is None:
-                    continue
-                    
-                logger.debug(f"Processing page {page_idx + 1}")
+            try:
+                # Phase 1: Input handling - load and normalize document
+                document = input_handler.load(str(file_path))
                 
-                # Phase 2: OCR processing
-                ocr_result = ocr_engine.extract(image)
+                # Process each page (for multi-page documents)
+                images = document.images if hasattr(document, 'images') else []
                 
-                # Phase 3: Model inference - extract fields
-                extraction = extractor.extract(
-                    image=image,
-                    ocr_result=ocr_result,
-                    source_file=str(file_path)
-                )
-                
-                # Phase 4: Post-processing - normalize and validate
-                processed_result = post_processor.process(extraction)
-                
-                extraction_results.append(processed_result)
-                
-                logger.info(
-                    f"  Extracted: Invoice #{processed_result.invoice_number or 'N/A'}, "
-                    f"Confidence: {processed_result.average_confidence:.2f}"
-                )
+                for page_idx, image in enumerate(images):
+                    if image is None:
+                        continue
+                        
+                    logger.debug(f"Processing page {page_idx + 1}")
+                    
+                    # Phase 2: OCR processing
+                    ocr_result = ocr_engine.extract(image)
+                    
+                    # Phase 3: Model inference - extract fields
+                    extraction = extractor.extract(
+                        image=image,
+                        ocr_result=ocr_result,
+                        source_file=str(file_path)
+                    )
+                    
+                    # Phase 4: Post-processing - normalize and validate
+                    processed_result = post_processor.process(extraction)
+                    
+                    # The processed result is a copy; reuse the raw one's containers
+                    ExtractionResult.recycle(extraction)
+                    
+                    extraction_results.append(processed_result)
+                    
+                    logger.info(
+                        f"  Extracted: Invoice #{processed_result.invoice_number or 'N/A'}, "
+                        f"Confidence: {processed_result.average_confidence:.2f}"
+                    )
+            
+            except Exception as e:
+                logger.error(f"Error processing {file_path.name}: {e}")
+                continue
         
-        except Exception as e:
-            logger.error(f"Error processing {file_path.name}: {e}")
-            continue
+    finally:
+        # Stop OCR worker processes; nothing below needs them
+        ocr_engine.close()
     
     # Phase 5: Output generation
     if extraction_results:
@@ -328,6 +336,20 @@ def run_extraction(
         if output_info.get('excel_path'):
             logger.info(f"Excel output: {output_info['excel_path']}")
         
+        if output_info.get('csv_path'):
+            logger.info(f"CSV output: {output_info['csv_path']}")
+        
+        # save() buffers database rows; write whatever is still pending
+        if output_handler.database_enabled:
+            try:
+                flushed = output_handler.flush()
+                db_info = output_info.get('database_records') or {'inserted': 0, 'skipped': 0}
+                output_info['database_records'] = {
+                    key: db_info[key] + flushed[key] for key in ('inserted', 'skipped')
+                }
+            except Exception as e:
+                logger.error(f"Database save failed: {e}")
+        
         if output_info.get('database_records'):
             db_info = output_info['database_records']
             logger.info(
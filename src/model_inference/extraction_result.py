@@ -8,9 +8,43 @@ Author: ML Engineering Team
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime
+import threading
+import time
+
+
+# Recycled containers for batch pipelines (see ExtractionResult.acquire
+# and ExtractionResult.recycle). Bounded so an idle pool can't grow
+# without limit after a large batch.
+_POOL_MAX_SIZE = 256
+_DICT_POOL: List[dict] = []
+_LIST_POOL: List[list] = []
+_POOL_LOCK = threading.Lock()
+
+# Last (second, formatted prefix) pair used by _timestamp_now
+_TIMESTAMP_CACHE = (None, '')
+
+
+def _timestamp_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string.
+    
+    Equivalent to ``datetime.now().isoformat()`` (always with
+    microseconds), but the date/time prefix is only re-formatted once
+    per second, which keeps bulk result construction cheap.
+    
+    Returns:
+        Timestamp string, e.g. "2026-01-21T14:30:22.123456".
+    """
+    global _TIMESTAMP_CACHE
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _TIMESTAMP_CACHE
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        _TIMESTAMP_CACHE = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}"
 
 
 @dataclass
@@ -73,7 +107,60 @@ class ExtractionResult:
     def __post_init__(self):
         """Initialize timestamp if not provided."""
         if self.extraction_timestamp is None:
-            self.extraction_timestamp = datetime.now().isoformat()
+            self.extraction_timestamp = _timestamp_now()
+    
+    @classmethod
+    def acquire(cls, **kwargs: Any) -> 'ExtractionResult':
+        """
+        Create a result reusing pooled containers where available.
+        
+        Containers returned to the pool via ``recycle`` are reused for
+        ``confidence_scores``, ``raw_extractions``, ``errors`` and
+        ``warnings``. With an empty pool this behaves exactly like the
+        normal constructor.
+        
+        Args:
+            **kwargs: Field values, as for the constructor.
+            
+        Returns:
+            ExtractionResult instance.
+        """
+        with _POOL_LOCK:
+            for name in ('confidence_scores', 'raw_extractions'):
+                if name not in kwargs and _DICT_POOL:
+                    kwargs[name] = _DICT_POOL.pop()
+            for name in ('errors', 'warnings'):
+                if name not in kwargs and _LIST_POOL:
+                    kwargs[name] = _LIST_POOL.pop()
+        return cls(**kwargs)
+    
+    @staticmethod
+    def recycle(result: 'ExtractionResult') -> None:
+        """
+        Return a result's containers to the pool.
+        
+        Only call this once nothing else references the result or its
+        containers (e.g. after post-processing has copied it); the
+        containers are cleared and detached from the result.
+        
+        Args:
+            result: ExtractionResult that is no longer needed.
+        """
+        containers = (
+            result.confidence_scores, result.raw_extractions,
+            result.errors, result.warnings
+        )
+        result.confidence_scores = {}
+        result.raw_extractions = {}
+        result.errors = []
+        result.warnings = []
+        
+        with _POOL_LOCK:
+            for container in containers:
+                pool = _DICT_POOL if isinstance(container, dict) else _LIST_POOL
+                if len(pool) < _POOL_MAX_SIZE:
+                    container.clear()
+                    pool.append(container)
     
     @property
     def fields(self) -> Dict[str, Optional[str]]:
@@ -17,6 +17,7 @@ Supported Models:
 Author: ML Engineering Team
 """
 
+import re
 import time
 from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
@@ -24,6 +25,7 @@ from PIL import Image
 
 from config import get_config
 from src.utils.logger import get_logger
+from src.utils.helpers import ensure_directory, safe_filename
 from src.utils.exceptions import ModelLoadError, InferenceError
 from src.ocr_engine.ocr_result import OCRResult
 from .extraction_result import ExtractionResult
@@ -31,6 +33,70 @@ from .extraction_result import ExtractionResult
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Default questions for each target field. Shared across extractor
+# instances, so treat as read-only: copy before merging overrides.
+_DEFAULT_FIELD_QUESTIONS: Dict[str, Dict[str, Any]] = {
+    'invoice_number': {
+        'question': 'What is the invoice number?',
+        'aliases': ['Invoice No', 'Invoice #', 'Inv No', 'Bill No']
+    },
+    'invoice_date': {
+        'question': 'What is the invoice date?',
+        'aliases': ['Date', 'Invoice Date', 'Bill Date']
+    },
+    'vendor_name': {
+        'question': 'What is the vendor or seller company name?',
+        'aliases': ['Vendor', 'Seller', 'From', 'Company']
+    },
+    'customer_name': {
+        'question': 'What is the customer or buyer name?',
+        'aliases': ['Customer', 'Buyer', 'Bill To', 'Ship To']
+    },
+    'total_amount': {
+        'question': 'What is the total amount?',
+        'aliases': ['Total', 'Grand Total', 'Amount Due', 'Total Due']
+    },
+    'payment_due_date': {
+        'question': 'What is the payment due date?',
+        'aliases': ['Due Date', 'Payment Due', 'Pay By']
+    }
+}
+
+
+# Model types optimum cannot export for question answering; the
+# onnxruntime runtime is refused for these instead of failing the export
+_ONNX_UNSUPPORTED_QA_MODEL_TYPES = frozenset({'layoutlm'})
+
+# Written to the ONNX cache directory when an export fails
+_ONNX_EXPORT_FAILED_MARKER = "export_failed"
+
+
+# Regex fallback patterns for fields the model missed, compiled once
+_REGEX_FALLBACK_PATTERNS: Dict[str, List[re.Pattern]] = {
+    field: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for field, patterns in {
+        'invoice_number': [
+            r'Invoice\s*(?:#|No\.?|Number)?\s*[:\s]?\s*([A-Z0-9-]+)',
+            r'INV[:\s-]?\s*([A-Z0-9-]+)',
+            r'Bill\s*(?:#|No\.?)?\s*[:\s]?\s*([A-Z0-9-]+)'
+        ],
+        'total_amount': [
+            r'Total\s*(?:Amount|Due)?\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)',
+            r'Grand\s*Total\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)',
+            r'Amount\s*Due\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)'
+        ],
+        'invoice_date': [
+            r'(?:Invoice\s*)?Date\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'Dated?\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})'
+        ],
+        'payment_due_date': [
+            r'Due\s*Date\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'Pay(?:ment)?\s*(?:Due\s*)?By\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+        ]
+    }.items()
+}
+
 
 class InvoiceExtractor:
     """
@@ -61,6 +127,16 @@ class InvoiceExtractor:
     # Fallback model if default not available
     FALLBACK_MODEL = "deepset/roberta-base-squad2"
     
+    # Leading characters of OCR text searched first by the regex fallback
+    HEADER_REGION_CHARS = 2000
+    
+    # Fields printed in the invoice header; others (e.g. total_amount,
+    # usually in the footer) are always searched in the full text
+    HEADER_FIELDS = frozenset({
+        'invoice_number', 'invoice_date', 'payment_due_date',
+        'vendor_name', 'customer_name'
+    })
+    
     def __init__(
         self,
         model_name: Optional[str] = None,
@@ -78,6 +154,8 @@ class InvoiceExtractor:
         self.model_name = model_name or get_config("model.name", self.DEFAULT_MODEL)
         self.device = device or get_config("model.inference.device", "cpu")
         self.max_length = get_config("model.inference.max_length", 512)
+        self.quantize = get_config("model.inference.quantize", None)
+        self.runtime = get_config("model.inference.runtime", "pytorch")
         
         # Load field questions from config
         self.field_questions = self._load_field_questions()
@@ -93,45 +171,27 @@ class InvoiceExtractor:
         """
         Load field extraction questions from configuration.
         
+        Each extractor gets its own copy of the per-field settings and
+        their alias lists, so changing them never affects the module-level
+        defaults or the loaded configuration.
+        
         Returns:
             Dictionary mapping field names to question configs.
         """
-        default_questions = {
-            'invoice_number': {
-                'question': 'What is the invoice number?',
-                'aliases': ['Invoice No', 'Invoice #', 'Inv No', 'Bill No']
-            },
-            'invoice_date': {
-                'question': 'What is the invoice date?',
-                'aliases': ['Date', 'Invoice Date', 'Bill Date']
-            },
-            'vendor_name': {
-                'question': 'What is the vendor or seller company name?',
-                'aliases': ['Vendor', 'Seller', 'From', 'Company']
-            },
-            'customer_name': {
-                'question': 'What is the customer or buyer name?',
-                'aliases': ['Customer', 'Buyer', 'Bill To', 'Ship To']
-            },
-            'total_amount': {
-                'question': 'What is the total amount?',
-                'aliases': ['Total', 'Grand Total', 'Amount Due', 'Total Due']
-            },
-            'payment_due_date': {
-                'question': 'What is the payment due date?',
-                'aliases': ['Due Date', 'Payment Due', 'Pay By']
-            }
-        }
+        config_fields = get_config("model.extraction_fields", None) or {}
         
-        # Try to load from config
-        config_fields = get_config("model.extraction_fields", {})
+        questions = {
+            field: settings.copy()
+            for field, settings in _DEFAULT_FIELD_QUESTIONS.items()
+        }
+        for field, settings in config_fields.items():
+            if field in questions:
+                questions[field].update(settings)
         
-        if config_fields:
-            for field, settings in config_fields.items():
-                if field in default_questions:
-                    default_questions[field].update(settings)
+        for settings in questions.values():
+            settings['aliases'] = list(settings.get('aliases', []))
         
-        return default_questions
+        return questions
     
     def _initialize_model(self) -> None:
         """
@@ -150,11 +210,16 @@ class InvoiceExtractor:
             
             # Try to load document-qa pipeline
             try:
-                self.pipeline = pipeline(
-                    "document-question-answering",
-                    model=self.model_name,
-                    device=0 if self.device == "cuda" else -1
-                )
+                if self.runtime == "onnxruntime":
+                    self.pipeline = self._load_onnx_pipeline(pipeline)
+                
+                if self.pipeline is None:
+                    self.runtime = "pytorch"
+                    self.pipeline = pipeline(
+                        "document-question-answering",
+                        model=self.model_name,
+                        device=0 if self.device == "cuda" else -1
+                    )
                 self.use_document_qa = True
                 logger.info(f"Loaded document-qa pipeline successfully")
                 
@@ -184,6 +249,189 @@ class InvoiceExtractor:
                 self.model_name,
                 "transformers package not installed. Install with: pip install transformers"
             )
+        
+        if self.quantize and self.runtime == "pytorch":
+            self._quantize_model()
+    
+    def _load_onnx_pipeline(self, pipeline_factory):
+        """
+        Load the document-qa model through ONNX Runtime.
+        
+        The model is exported to ONNX once and cached under
+        ``paths.models_cache``; later extractor instances load the cached
+        graph directly instead of re-exporting. The graph is run through
+        ``ORTModelForCustomTasks``, which feeds every input the graph
+        declares (including ``bbox`` for layout-aware models) rather than
+        only the text inputs of a plain extractive QA model.
+        
+        Args:
+            pipeline_factory: transformers ``pipeline`` function.
+            
+        Returns:
+            Pipeline backed by an ONNX Runtime session, or None if
+            optimum/onnxruntime are unavailable, the export fails or the
+            load-time smoke inference does not pass.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForCustomTasks
+            from transformers import AutoTokenizer
+        except ImportError:
+            logger.warning(
+                "optimum[onnxruntime] not installed, using PyTorch runtime. "
+                "Install with: pip install optimum[onnxruntime]"
+            )
+            return None
+        
+        cache_root = Path(get_config("paths.models_cache", "models"))
+        onnx_dir = cache_root / "onnx" / safe_filename(self.model_name)
+        provider = (
+            "CUDAExecutionProvider" if self.device == "cuda"
+            else "CPUExecutionProvider"
+        )
+        
+        if (onnx_dir / "model.onnx").exists():
+            logger.info(f"Loading cached ONNX model: {onnx_dir}")
+        elif not self._export_onnx(onnx_dir):
+            return None
+        
+        try:
+            model = ORTModelForCustomTasks.from_pretrained(
+                onnx_dir, provider=provider
+            )
+            tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+            
+            onnx_pipeline = pipeline_factory(
+                "document-question-answering",
+                model=model,
+                tokenizer=tokenizer
+            )
+            self._check_onnx_pipeline(onnx_pipeline)
+            logger.info(f"Loaded ONNX Runtime pipeline ({provider})")
+            return onnx_pipeline
+            
+        except Exception as e:
+            logger.warning(f"Could not load ONNX model, using PyTorch runtime: {e}")
+            return None
+    
+    def _export_onnx(self, onnx_dir: Path) -> bool:
+        """
+        Export the document-qa model to ONNX for question answering.
+        
+        optimum has no question-answering ONNX config for LayoutLM v1
+        (the default ``impira/layoutlm-document-qa``), so those models are
+        rejected before any weights are loaded. A failed export leaves an
+        ``export_failed`` marker in ``onnx_dir`` so later extractor starts
+        go straight to PyTorch; delete it to retry.
+        
+        Args:
+            onnx_dir: Directory the exported model is written to.
+            
+        Returns:
+            True if ``onnx_dir`` now holds an exported model.
+        """
+        failed_marker = onnx_dir / _ONNX_EXPORT_FAILED_MARKER
+        if failed_marker.exists():
+            logger.warning(
+                f"ONNX export of {self.model_name} failed previously, "
+                f"using PyTorch runtime (delete {failed_marker} to retry)"
+            )
+            return False
+        
+        try:
+            from optimum.exporters.onnx import main_export
+            from transformers import AutoConfig
+            
+            model_type = AutoConfig.from_pretrained(self.model_name).model_type
+            if model_type in _ONNX_UNSUPPORTED_QA_MODEL_TYPES:
+                logger.error(
+                    f"runtime 'onnxruntime' is not supported for {model_type} "
+                    f"models ({self.model_name}): optimum cannot export them "
+                    f"for question answering. Using PyTorch runtime; set "
+                    f"model.runtime to 'pytorch' to silence this error"
+                )
+                return False
+            
+            logger.info(f"Exporting {self.model_name} to ONNX: {onnx_dir}")
+            ensure_directory(onnx_dir)
+            main_export(
+                self.model_name,
+                output=onnx_dir,
+                task="question-answering"
+            )
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Could not export ONNX model, using PyTorch runtime: {e}")
+            try:
+                ensure_directory(onnx_dir)
+                failed_marker.write_text(f"{e}\n", encoding="utf-8")
+            except OSError:
+                pass
+            return False
+    
+    def _check_onnx_pipeline(self, onnx_pipeline) -> None:
+        """
+        Verify an ONNX document-qa pipeline before it is used.
+        
+        Field extraction swallows inference errors, so a graph that cannot
+        consume layout inputs would otherwise silently return no answers
+        for every field.
+        
+        Args:
+            onnx_pipeline: Pipeline returned by ``_load_onnx_pipeline``.
+            
+        Raises:
+            ModelLoadError: If the graph has no ``bbox`` input or the
+                smoke inference fails.
+        """
+        model = onnx_pipeline.model
+        session = getattr(model, "session", None) or getattr(model, "model", None)
+        input_names = {node.name for node in session.get_inputs()}
+        
+        if "bbox" not in input_names:
+            raise ModelLoadError(
+                self.model_name,
+                f"ONNX graph has no bbox input (inputs: {sorted(input_names)})"
+            )
+        
+        # Supplying word boxes keeps the smoke test independent of Tesseract
+        result = onnx_pipeline(
+            image=Image.new("RGB", (200, 100), "white"),
+            question="What is the invoice number?",
+            word_boxes=[("Invoice", [10, 10, 80, 30]), ("123", [90, 10, 120, 30])]
+        )
+        
+        if not result:
+            raise ModelLoadError(self.model_name, "ONNX smoke inference returned no answer")
+    
+    def _quantize_model(self) -> None:
+        """
+        Apply dynamic int8 quantization to the loaded model.
+        
+        Linear layers are quantized with torch dynamic quantization,
+        which uses int8 (VNNI where available) kernels on CPU. Only
+        supported on CPU; on failure the FP32 model is kept.
+        """
+        if self.quantize != "int8":
+            logger.warning(f"Unsupported quantization mode: {self.quantize}")
+            return
+        
+        if self.device != "cpu":
+            logger.warning("int8 dynamic quantization is only supported on CPU, skipping")
+            return
+        
+        try:
+            import torch
+            
+            self.pipeline.model = torch.ao.quantization.quantize_dynamic(
+                self.pipeline.model,
+                {torch.nn.Linear},
+                dtype=torch.qint8
+            )
+            logger.info("Applied int8 dynamic quantization to model")
+            
+        except Exception as e:
+            logger.warning(f"Model quantization failed, using FP32 model: {e}")
     
     def extract(
         self,
@@ -214,15 +462,14 @@ class InvoiceExtractor:
         start_time = time.time()
         
         # Create result object
-        result = ExtractionResult(
+        result = ExtractionResult.acquire(
             source_file=source_file,
             model_name=self.model_name
         )
         
         try:
             # Ensure image is in correct format
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            image = self._ensure_rgb(image)
             
             # Extract each field
             for field_name, field_config in self.field_questions.items():
@@ -270,6 +517,30 @@ class InvoiceExtractor:
             result.processing_time = time.time() - start_time
             return result
     
+    @staticmethod
+    def _ensure_rgb(image: Image.Image) -> Image.Image:
+        """
+        Return an RGB version of the image, converting only when needed.
+        
+        RGB images are returned as-is (no copy). Images with an alpha
+        channel are composited onto a white background so transparent
+        regions don't turn black.
+        
+        Args:
+            image: Input PIL Image.
+            
+        Returns:
+            RGB PIL Image.
+        """
+        mode = image.mode
+        if mode == 'RGB':
+            return image
+        if mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB')
+    
     def _extract_field(
         self,
         image: Image.Image,
@@ -386,47 +657,41 @@ class InvoiceExtractor:
         """
         Apply regex patterns to find missing fields.
         
+        Header fields almost always appear near the top of the page, so
+        they are first searched in the leading header region of the text
+        and only in the full text if nothing matched there. Other fields
+        are searched in the full text only. Within each region the
+        patterns are tried in their original priority order.
+        
         Args:
             result: ExtractionResult to update.
             text: OCR text to search.
         """
-        import re
-        
-        patterns = {
-            'invoice_number': [
-                r'Invoice\s*(?:#|No\.?|Number)?\s*[:\s]?\s*([A-Z0-9-]+)',
-                r'INV[:\s-]?\s*([A-Z0-9-]+)',
-                r'Bill\s*(?:#|No\.?)?\s*[:\s]?\s*([A-Z0-9-]+)'
-            ],
-            'total_amount': [
-                r'Total\s*(?:Amount|Due)?\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)',
-                r'Grand\s*Total\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)',
-                r'Amount\s*Due\s*[:\s]?\s*\$?\s*([\d,]+\.?\d*)'
-            ],
-            'invoice_date': [
-                r'(?:Invoice\s*)?Date\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'Dated?\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})'
-            ],
-            'payment_due_date': [
-                r'Due\s*Date\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'Pay(?:ment)?\s*(?:Due\s*)?By\s*[:\s]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-            ]
-        }
+        head = text[:self.HEADER_REGION_CHARS]
+        header_regions = (head, text) if len(text) > len(head) else (text,)
+        full_regions = (text,)
         
         for field in result.missing_fields:
-            if field not in patterns:
+            patterns = _REGEX_FALLBACK_PATTERNS.get(field)
+            if not patterns:
                 continue
             
-            for pattern in patterns[field]:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    value = match.group(1).strip()
-                    if value:
-                        result.set_field(field, value, 0.3)  # Low confidence for regex
-                        result.add_warning(f"{field} extracted via regex fallback")
-                        logger.debug(f"Regex fallback for {field}: {value}")
-                        break
+            regions = header_regions if field in self.HEADER_FIELDS else full_regions
+            value = None
+            for region in regions:
+                for pattern in patterns:
+                    match = pattern.search(region)
+                    if match:
+                        value = match.group(1).strip()
+                        if value:
+                            break
+                if value:
+                    break
+            
+            if value:
+                result.set_field(field, value, 0.3)  # Low confidence for regex
+                result.add_warning(f"{field} extracted via regex fallback")
+                logger.debug(f"Regex fallback for {field}: {value}")
     
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -440,5 +705,7 @@ class InvoiceExtractor:
             'device': self.device,
             'use_document_qa': self.use_document_qa,
             'max_length': self.max_length,
+            'quantize': self.quantize,
+            'runtime': self.runtime,
             'fields': list(self.field_questions.keys())
         }
@@ -18,5 +18,6 @@ Author: ML Engineering Team
 from .engine import OCREngine
 from .tesseract_backend import TesseractBackend
 from .ocr_result import OCRResult, OCRWord, OCRLine
+from .ocr_cache import OCRCache
 
-__all__ = ['OCREngine', 'TesseractBackend', 'OCRResult', 'OCRWord', 'OCRLine']
+__all__ = ['OCREngine', 'TesseractBackend', 'OCRResult', 'OCRWord', 'OCRLine', 'OCRCache']
@@ -19,11 +19,20 @@ Usage:
 Author: ML Engineering Team
 """
 
+import atexit
+import hashlib
+import importlib
+import mmap
+import os
+import tempfile
+import threading
 import time
 from typing import Union, Optional, Dict, Any, List
 from PIL import Image
 from pathlib import Path
 
+import numpy as np
+
 from config import get_config
 from src.utils.logger import get_logger
 from src.utils.exceptions import OCREngineNotAvailableError, OCRProcessingError
@@ -33,6 +42,67 @@ from .tesseract_backend import TesseractBackend
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Shared placeholder returned by extract_batch for failed images.
+# Callers must not mutate it.
+_EMPTY_RESULT = OCRResult()
+
+# Heavy model-based backends (EasyOCR/PaddleOCR) shared across engine
+# instances, keyed by (engine, language(s), option)
+_BACKEND_CACHE: Dict[tuple, Any] = {}
+_BACKEND_CACHE_LOCK = threading.Lock()
+
+
+# Imported optional backend modules (None records a failed import)
+_BACKEND_MODULES: Dict[str, Any] = {}
+
+
+def _import_backend_module(name: str):
+    """
+    Import an optional OCR backend package once per process.
+    
+    Failed imports are remembered too, so engines created after a
+    missing-package fallback don't rescan sys.path every time.
+    
+    Args:
+        name: Module name (e.g. "easyocr").
+        
+    Returns:
+        Imported module.
+        
+    Raises:
+        ImportError: If the package is not installed.
+    """
+    if name not in _BACKEND_MODULES:
+        try:
+            _BACKEND_MODULES[name] = importlib.import_module(name)
+        except ImportError:
+            _BACKEND_MODULES[name] = None
+    
+    module = _BACKEND_MODULES[name]
+    if module is None:
+        raise ImportError(f"No module named '{name}'")
+    return module
+
+
+def _get_cached_backend(key: tuple, factory):
+    """
+    Get a shared backend instance, creating it on first use.
+    
+    Args:
+        key: Cache key identifying the backend configuration.
+        factory: Zero-argument callable that builds the backend.
+        
+    Returns:
+        Backend instance shared by all engines with the same key.
+    """
+    with _BACKEND_CACHE_LOCK:
+        backend = _BACKEND_CACHE.get(key)
+        if backend is None:
+            logger.info(f"Loading OCR backend: {key[0]}")
+            backend = factory()
+            _BACKEND_CACHE[key] = backend
+        return backend
+
 
 class OCREngine:
     """
@@ -64,6 +134,9 @@ class OCREngine:
         >>> 
         >>> # Get in LayoutLM format
         >>> layoutlm_data = result.to_layoutlm_format()
+        >>> 
+        >>> # Shut down batch worker processes when done
+        >>> engine.close()
     """
     
     # Supported backend engines
@@ -90,6 +163,15 @@ class OCREngine:
         # Get normalization scale from config
         self.normalize_scale = get_config("ocr.bbox.scale_factor", 1000)
         
+        # Largest side to decode file inputs at (JPEG draft mode)
+        self.max_dim = get_config("ocr.max_dim", 2400)
+        
+        # Memory-mapped cache of decoded pixels (off by default)
+        self.pixel_cache = get_config("ocr.pixel_cache.enabled", False)
+        self.pixel_cache_dir = Path(
+            get_config("paths.temp_dir", "data/temp")
+        ) / "pixel_cache"
+        
         logger.info(f"OCR Engine initialized with backend: {self.backend_name}")
     
     def _initialize_backend(self):
@@ -121,15 +203,20 @@ class OCREngine:
     def _init_easyocr_backend(self):
         """Initialize EasyOCR backend (if available)."""
         try:
-            import easyocr
+            easyocr = _import_backend_module("easyocr")
             
             languages = get_config("ocr.easyocr.languages", ["en"])
             gpu = get_config("ocr.easyocr.gpu", False)
+            batch_size = get_config("ocr.easyocr.batch_size", 8)
             
-            reader = easyocr.Reader(languages, gpu=gpu)
-            
-            # Return wrapper that implements extract method
-            return EasyOCRWrapper(reader)
+            # Return shared wrapper that implements extract method
+            return _get_cached_backend(
+                ('easyocr', tuple(languages), gpu),
+                lambda: EasyOCRWrapper(
+                    easyocr.Reader(languages, gpu=gpu),
+                    batch_size=batch_size
+                )
+            )
             
         except ImportError:
             logger.warning("EasyOCR not available, falling back to Tesseract")
@@ -139,18 +226,54 @@ class OCREngine:
     def _init_paddleocr_backend(self):
         """Initialize PaddleOCR backend (if available)."""
         try:
-            from paddleocr import PaddleOCR
-            
-            ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
+            PaddleOCR = _import_backend_module("paddleocr").PaddleOCR
             
-            # Return wrapper that implements extract method
-            return PaddleOCRWrapper(ocr)
+            # Return shared wrapper that implements extract method
+            return _get_cached_backend(
+                ('paddleocr', 'en', True),
+                lambda: PaddleOCRWrapper(
+                    PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
+                )
+            )
             
         except ImportError:
             logger.warning("PaddleOCR not available, falling back to Tesseract")
             self.backend_name = "tesseract"
             return TesseractBackend()
     
+    @staticmethod
+    def close_all() -> None:
+        """
+        Release all shared OCR backend instances.
+        
+        Registered with ``atexit``; can also be called explicitly to
+        free model memory. Later engines will reload their backend.
+        """
+        with _BACKEND_CACHE_LOCK:
+            backends = list(_BACKEND_CACHE.values())
+            _BACKEND_CACHE.clear()
+        for backend in backends:
+            if hasattr(backend, 'close'):
+                backend.close()
+    
+    def close(self) -> None:
+        """
+        Release worker processes held by the backend.
+        
+        The backend instance stays usable; a later batch call starts a
+        new worker pool.
+        """
+        if hasattr(self.backend, 'close'):
+            self.backend.close()
+    
+    def __enter__(self) -> 'OCREngine':
+        """Enter a context that closes the engine on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the engine when leaving the context."""
+        self.close()
+    
     def extract(self, image: Union[Image.Image, str, Path]) -> OCRResult:
         """
         Extract text and bounding boxes from an image.
@@ -177,7 +300,7 @@ class OCREngine:
             image_path = str(image)
             logger.debug(f"Loading image from: {image_path}")
             try:
-                image = Image.open(image_path)
+                image = self._load_image(image_path)
             except Exception as e:
                 raise OCRProcessingError(image_path, f"Failed to load image: {e}")
         
@@ -210,7 +333,7 @@ class OCREngine:
         # Load image if path is provided
         if isinstance(image, (str, Path)):
             try:
-                image = Image.open(str(image))
+                image = self._load_image(str(image))
             except Exception as e:
                 logger.error(f"Failed to load image: {e}")
                 return ""
@@ -221,6 +344,90 @@ class OCREngine:
             result = self.extract(image)
             return result.text
     
+    def _load_image(self, image_path: str) -> Image.Image:
+        """
+        Open an image file for OCR without decoding it up front.
+        
+        PIL opens images lazily; pixels are decoded when the backend
+        first touches them. For oversized JPEG scans, ``draft`` makes the
+        decoder scale down by a power of two during decoding (libjpeg
+        DCT scaling), never below ``ocr.max_dim`` on either side.
+        
+        When ``ocr.pixel_cache.enabled`` is set, decoded pixels are kept
+        as ``.npy`` files and memory-mapped on later loads of the same
+        unchanged file, skipping the decode entirely. Entries are written
+        atomically but never evicted; the cache directory grows until it
+        is cleared by hand.
+        
+        Args:
+            image_path: Path to the image file.
+            
+        Returns:
+            Lazily-loaded PIL Image.
+        """
+        cache_path = self._pixel_cache_path(image_path) if self.pixel_cache else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                return Image.fromarray(np.load(cache_path, mmap_mode='r'))
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable pixel cache {cache_path}: {e}")
+        
+        image = self._mmap_load(image_path)
+        
+        if self.max_dim and max(image.size) > self.max_dim:
+            image.draft(image.mode, (self.max_dim, self.max_dim))
+        
+        if cache_path is not None:
+            image = image.convert('RGB')
+            self._write_pixel_cache(cache_path, np.asarray(image))
+        
+        return image
+    
+    @staticmethod
+    def _mmap_load(image_path: str) -> Image.Image:
+        """
+        Open an image over a read-only memory map of the file.
+        
+        The decoder reads straight from the OS page cache, so retries and
+        repeated batches over the same scans do not re-read the file.
+        """
+        with open(image_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # PIL keeps the mmap as its file object until the image is loaded
+        return Image.open(mapped)
+    
+    def _write_pixel_cache(self, cache_path: Path, pixels: np.ndarray) -> None:
+        """
+        Write decoded pixels to the pixel cache.
+        
+        The array goes to a temporary file in the cache directory first and
+        is then renamed into place, so concurrent readers never map a
+        truncated ``.npy`` and a crash leaves no partial entry behind.
+        """
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, pixels)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write pixel cache {cache_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def _pixel_cache_path(self, image_path: str) -> Optional[Path]:
+        """Return the pixel cache file for an image, keyed by path and mtime."""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        
+        key = f"{os.path.abspath(image_path)}|{stat.st_mtime_ns}|{stat.st_size}|{self.max_dim}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.pixel_cache_dir / f"{digest}.npy"
+    
     def extract_batch(
         self,
         images: List[Union[Image.Image, str, Path]]
@@ -228,26 +435,84 @@ class OCREngine:
         """
         Extract from multiple images.
         
+        Backends with an ``extract_many`` method get the whole batch in
+        one call (EasyOCR batches on the model, Tesseract spreads pages
+        over worker processes). Other readers are not thread-safe and
+        are run sequentially.
+        
         Args:
             images: List of PIL Images or paths.
             
         Returns:
-            List of OCRResult objects.
+            List of OCRResult objects, in input order. Failed images map
+            to a shared, read-only empty OCRResult.
+        """
+        if hasattr(self.backend, 'extract_many'):
+            return self._extract_many(images)
+        
+        return [
+            self._extract_for_batch(i, image, len(images))
+            for i, image in enumerate(images)
+        ]
+    
+    def _extract_many(
+        self,
+        images: List[Union[Image.Image, str, Path]]
+    ) -> List[OCRResult]:
         """
-        results = []
+        Run a batch through the backend's ``extract_many`` method.
         
+        Images that fail to load map to the empty result. If the batched
+        call itself fails, images are processed one at a time instead.
+        """
+        loaded: List[Optional[Image.Image]] = []
         for i, image in enumerate(images):
-            logger.debug(f"Processing image {i+1}/{len(images)}")
-            try:
-                result = self.extract(image)
-                results.append(result)
-            except OCRProcessingError as e:
-                logger.error(f"Failed to process image {i+1}: {e}")
-                # Add empty result for failed images
-                results.append(OCRResult())
+            if isinstance(image, (str, Path)):
+                try:
+                    image = self._load_image(str(image))
+                except Exception as e:
+                    logger.error(f"Failed to process image {i+1}: {e}")
+                    image = None
+            elif not isinstance(image, Image.Image):
+                logger.error(f"Failed to process image {i+1}: Invalid image input")
+                image = None
+            loaded.append(image)
+        
+        valid = [i for i, image in enumerate(loaded) if image is not None]
+        results = [_EMPTY_RESULT] * len(images)
+        
+        try:
+            logger.debug(f"Extracting {len(valid)} images in one batch")
+            batch_results = self.backend.extract_many([loaded[i] for i in valid])
+        except Exception as e:
+            logger.warning(f"Batched OCR failed, processing images individually: {e}")
+            batch_results = [
+                self._extract_for_batch(i, loaded[i], len(images)) for i in valid
+            ]
+        
+        for i, result in zip(valid, batch_results):
+            # Ensure bounding boxes are normalized
+            if result.words and result.words[0].normalized_bbox is None:
+                result.normalize_bboxes(self.normalize_scale)
+            results[i] = result
         
         return results
     
+    def _extract_for_batch(
+        self,
+        index: int,
+        image: Union[Image.Image, str, Path],
+        total: int
+    ) -> OCRResult:
+        """Extract one batch item, returning an empty result on failure."""
+        logger.debug(f"Processing image {index+1}/{total}")
+        try:
+            return self.extract(image)
+        except OCRProcessingError as e:
+            logger.error(f"Failed to process image {index+1}: {e}")
+            # Add empty result for failed images
+            return _EMPTY_RESULT
+    
     def get_backend_info(self) -> Dict[str, Any]:
         """
         Get information about the current OCR backend.
@@ -266,48 +531,122 @@ class OCREngine:
         return info
 
 
+def _image_to_array(image: Image.Image) -> np.ndarray:
+    """
+    View a PIL image as a C-contiguous NumPy array.
+    
+    Uses ``np.asarray`` so the pixel buffer exported by PIL is not
+    copied a second time; only copies when the result is not
+    contiguous.
+    
+    Args:
+        image: PIL Image.
+        
+    Returns:
+        Read-only (H, W[, C]) uint8 array.
+    """
+    img_array = np.asarray(image)
+    if not img_array.flags['C_CONTIGUOUS']:
+        img_array = np.ascontiguousarray(img_array)
+    return img_array
+
+
+def _quads_to_bboxes(quads: List[Any]) -> np.ndarray:
+    """
+    Reduce quadrilateral detections to axis-aligned boxes.
+    
+    Args:
+        quads: List of 4-point polygons ``[[x, y], ...]``.
+        
+    Returns:
+        (N, 4) int32 array of (x1, y1, x2, y2) boxes.
+    """
+    if not quads:
+        return np.empty((0, 4), dtype=np.int32)
+    
+    points = np.asarray(quads, dtype=np.float32)  # (N, 4, 2)
+    boxes = np.concatenate([points.min(axis=1), points.max(axis=1)], axis=1)
+    return boxes.astype(np.int32)
+
+
 class EasyOCRWrapper:
     """Wrapper for EasyOCR to provide consistent interface."""
     
-    def __init__(self, reader):
+    def __init__(self, reader, batch_size: int = 8):
         self.reader = reader
+        self.batch_size = batch_size
     
     def extract(self, image: Image.Image) -> OCRResult:
         """Extract text using EasyOCR."""
-        import numpy as np
-        
         start_time = time.time()
         
-        # Convert PIL to numpy
-        img_array = np.array(image)
-        
-        # Get image dimensions
-        image_height, image_width = img_array.shape[:2]
+        # Convert PIL to numpy (no extra copy)
+        img_array = _image_to_array(image)
         
         # Run OCR
         results = self.reader.readtext(img_array)
         
-        # Parse results
-        words = []
-        for i, (bbox, text, conf) in enumerate(results):
-            # EasyOCR returns bbox as [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
-            x_coords = [p[0] for p in bbox]
-            y_coords = [p[1] for p in bbox]
+        return self._build_result(results, image.size, time.time() - start_time)
+    
+    def extract_many(self, images: List[Image.Image]) -> List[OCRResult]:
+        """
+        Extract text from several images with batched EasyOCR calls.
+        
+        ``readtext_batched`` needs equally sized inputs to keep box
+        coordinates in image space, so images are grouped by size and
+        each group is run as one batch.
+        
+        Args:
+            images: List of PIL Images.
+            
+        Returns:
+            List of OCRResult objects, in input order.
+        """
+        groups: Dict[tuple, List[int]] = {}
+        for i, image in enumerate(images):
+            groups.setdefault(image.size, []).append(i)
+        
+        results: List[Optional[OCRResult]] = [None] * len(images)
+        for size, indices in groups.items():
+            if len(indices) == 1:
+                results[indices[0]] = self.extract(images[indices[0]])
+                continue
             
-            x1 = int(min(x_coords))
-            y1 = int(min(y_coords))
-            x2 = int(max(x_coords))
-            y2 = int(max(y_coords))
+            start_time = time.time()
+            batch = self.reader.readtext_batched(
+                [_image_to_array(images[i]) for i in indices],
+                batch_size=self.batch_size
+            )
+            per_image_time = (time.time() - start_time) / len(indices)
             
-            word = OCRWord(
+            for i, detections in zip(indices, batch):
+                results[i] = self._build_result(detections, size, per_image_time)
+        
+        return results
+    
+    def _build_result(
+        self,
+        results: List[Any],
+        image_size: tuple,
+        processing_time: float
+    ) -> OCRResult:
+        """Convert EasyOCR detections for one image into an OCRResult."""
+        # Get image dimensions
+        image_width, image_height = image_size
+        
+        # EasyOCR returns bbox as [[x1,y1], [x2,y1], [x2,y2], [x1,y2]];
+        # reduce all quadrilaterals to (x1, y1, x2, y2) boxes at once
+        bboxes = _quads_to_bboxes([bbox for bbox, _, _ in results])
+        
+        # Parse results; tolist() yields native ints in a single C call
+        words = [None] * len(results)
+        for i, ((_, text, conf), box) in enumerate(zip(results, bboxes.tolist())):
+            words[i] = OCRWord(
                 text=text,
-                bbox=(x1, y1, x2, y2),
+                bbox=tuple(box),
                 confidence=conf * 100,  # Convert to percentage
                 word_index=i
             )
-            words.append(word)
-        
-        processing_time = time.time() - start_time
         
         return OCRResult(
             words=words,
@@ -315,6 +654,7 @@ class EasyOCRWrapper:
             image_width=image_width,
             image_height=image_height,
             engine="easyocr",
+            bboxes=bboxes,
             processing_time=processing_time
         )
 
@@ -327,44 +667,32 @@ class PaddleOCRWrapper:
     
     def extract(self, image: Image.Image) -> OCRResult:
         """Extract text using PaddleOCR."""
-        import numpy as np
-        
         start_time = time.time()
         
-        # Convert PIL to numpy
-        img_array = np.array(image)
+        # Convert PIL to numpy (no extra copy)
+        img_array = _image_to_array(image)
         
         # Get image dimensions
-        image_height, image_width = img_array.shape[:2]
+        image_width, image_height = image.size
         
         # Run OCR
         results = self.ocr.ocr(img_array, cls=True)
         
         # Parse results
-        words = []
-        word_index = 0
-        
-        if results and results[0]:
-            for line in results[0]:
-                bbox, (text, conf) = line
-                
-                # PaddleOCR returns bbox as [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
-                
-                x1 = int(min(x_coords))
-                y1 = int(min(y_coords))
-                x2 = int(max(x_coords))
-                y2 = int(max(y_coords))
-                
-                word = OCRWord(
-                    text=text,
-                    bbox=(x1, y1, x2, y2),
-                    confidence=conf * 100,
-                    word_index=word_index
-                )
-                words.append(word)
-                word_index += 1
+        detections = results[0] if results and results[0] else []
+        
+        # PaddleOCR returns bbox as [[x1,y1], [x2,y1], [x2,y2], [x1,y2]];
+        # reduce all quadrilaterals to (x1, y1, x2, y2) boxes at once
+        bboxes = _quads_to_bboxes([bbox for bbox, _ in detections])
+        
+        words = [None] * len(detections)
+        for word_index, ((_, (text, conf)), box) in enumerate(zip(detections, bboxes.tolist())):
+            words[word_index] = OCRWord(
+                text=text,
+                bbox=tuple(box),
+                confidence=conf * 100,
+                word_index=word_index
+            )
         
         processing_time = time.time() - start_time
         
@@ -374,5 +702,9 @@ class PaddleOCRWrapper:
             image_width=image_width,
             image_height=image_height,
             engine="paddleocr",
+            bboxes=bboxes,
             processing_time=processing_time
         )
+
+
+atexit.register(OCREngine.close_all)
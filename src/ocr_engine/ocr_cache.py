@@ -0,0 +1,156 @@
+"""
+OCR Result Cache.
+
+This module provides an on-disk cache for OCR results, keyed by a
+hash of the image pixels and the OCR settings. Re-running OCR on a
+page that was already processed (re-runs, multi-pass pipelines,
+debugging) then costs a file read instead of a Tesseract call.
+
+Author: ML Engineering Team
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from PIL import Image
+
+from src.utils.logger import get_logger
+from src.utils.helpers import ensure_directory
+from .ocr_result import OCRResult
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# The only globals a cache entry may reference: the OCR result classes
+# and what NumPy needs to rebuild plain arrays (module path differs
+# between NumPy 1.x and 2.x)
+_ALLOWED_GLOBALS = frozenset({
+    ('src.ocr_engine.ocr_result', 'OCRResult'),
+    ('src.ocr_engine.ocr_result', 'OCRWord'),
+    ('src.ocr_engine.ocr_result', 'OCRLine'),
+    ('numpy', 'dtype'),
+    ('numpy.core.numeric', '_frombuffer'),
+    ('numpy._core.numeric', '_frombuffer'),
+})
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler that refuses every global outside _ALLOWED_GLOBALS."""
+    
+    def find_class(self, module: str, name: str) -> Any:
+        """
+        Resolve a global referenced by the pickle stream.
+        
+        Args:
+            module: Module name.
+            name: Attribute name.
+            
+        Returns:
+            The referenced class or function.
+            
+        Raises:
+            pickle.UnpicklingError: If the global is not allowed.
+        """
+        if (module, name) not in _ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(f"global '{module}.{name}' is not allowed")
+        return super().find_class(module, name)
+
+
+class OCRCache:
+    """
+    Pickle-based OCR result cache on disk.
+    
+    Each entry is stored as ``<cache_dir>/<key>.pkl``. Writes go to a
+    temporary file first and are renamed into place, so readers never
+    see a partial entry. Entries are loaded with an unpickler that only
+    resolves the OCR result classes and NumPy array helpers, so a
+    planted file cannot run arbitrary code.
+    
+    Attributes:
+        cache_dir: Directory holding cached results
+    
+    Example:
+        >>> cache = OCRCache("data/temp/ocr_cache")
+        >>> key = cache.make_key(image, "--psm 3 --oem 3|eng")
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = backend.extract(image)
+        ...     cache.put(key, result)
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory for cache files (created if missing).
+        """
+        self.cache_dir = ensure_directory(cache_dir)
+        logger.debug(f"OCRCache initialized (dir: {self.cache_dir})")
+    
+    @staticmethod
+    def make_key(image: Image.Image, settings: str) -> str:
+        """
+        Build a cache key from image content and OCR settings.
+        
+        Args:
+            image: PIL Image that will be sent to OCR.
+            settings: String describing every setting that affects output.
+        
+        Returns:
+            Hex digest identifying this image/settings combination.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.mode}|{image.size}|{settings}".encode('utf-8'))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[OCRResult]:
+        """
+        Load a cached result.
+        
+        Args:
+            key: Cache key from make_key().
+        
+        Returns:
+            Cached OCRResult, or None on a miss or unreadable entry.
+        """
+        path = self.cache_dir / f"{key}.pkl"
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                result = _RestrictedUnpickler(f).load()
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable OCR cache entry {path}: {e}")
+            return None
+        
+        if not isinstance(result, OCRResult):
+            logger.debug(f"Ignoring OCR cache entry {path}: not an OCRResult")
+            return None
+        return result
+    
+    def put(self, key: str, result: OCRResult) -> None:
+        """
+        Store a result atomically.
+        
+        Args:
+            key: Cache key from make_key().
+            result: OCRResult to store.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+        except Exception as e:
+            logger.debug(f"Could not write OCR cache entry {key}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
@@ -13,11 +13,53 @@ Author: ML Engineering Team
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Tuple
 import json
+import sys
 
+import numpy as np
 
-@dataclass
+# orjson is optional; when available it is used for JSON export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba is optional; when available, very large pages are normalized
+# with a parallel JIT kernel instead of NumPy temporaries
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum word count before the Numba kernel is preferred over NumPy
+NUMBA_MIN_WORDS = 4096
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+.
+# Only used for the per-word/per-line classes; OCRResult keeps a
+# __dict__ for its cached properties.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _normalize_kernel(bboxes, width, height, scale, out):
+        """Scale and clamp (N, 4) int32 boxes into ``out`` in parallel."""
+        for i in prange(bboxes.shape[0]):
+            for j in range(4):
+                size = width if j % 2 == 0 else height
+                value = (np.int64(bboxes[i, j]) * scale) // size
+                if value < 0:
+                    value = 0
+                elif value > scale:
+                    value = scale
+                out[i, j] = value
+
+
+@dataclass(**_SLOTS)
 class OCRWord:
     """
     Represents a single word/token extracted by OCR.
@@ -94,7 +136,7 @@ class OCRWord:
         return f"OCRWord('{self.text}', bbox={self.bbox}, conf={self.confidence:.1f})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCRLine:
     """
     Represents a line of text containing multiple words.
@@ -112,11 +154,14 @@ class OCRLine:
     words: List[OCRWord] = field(default_factory=list)
     bbox: Optional[Tuple[int, int, int, int]] = None
     line_index: int = 0
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def text(self) -> str:
-        """Get the full text of the line."""
-        return ' '.join(word.text for word in self.words)
+        """Get the full text of the line (joined once, then cached)."""
+        if self._text is None:
+            self._text = ' '.join(word.text for word in self.words)
+        return self._text
     
     @property
     def average_confidence(self) -> float:
@@ -167,6 +212,14 @@ class OCRResult:
         engine: OCR engine name
         processing_time: Time taken for OCR in seconds
         metadata: Additional metadata dictionary
+        bboxes: (N, 4) int32 array of word boxes, parallel to ``words``
+        confidences: (N,) float64 array of word confidences
+        line_ids: (N,) int32 array of word line indices
+        normalized_bboxes: (N, 4) int32 array set by normalize_bboxes()
+    
+    The arrays are a struct-of-arrays mirror of ``words``; they are built
+    from the words at construction time if not supplied, so treat the
+    word list as read-only once the result has been created.
         
     Example:
         >>> result = ocr_engine.extract(image)
@@ -181,12 +234,43 @@ class OCRResult:
     engine: str = "unknown"
     processing_time: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    bboxes: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    confidences: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    line_ids: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    normalized_bboxes: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _layoutlm_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-    @property
+    def __post_init__(self) -> None:
+        """Build the struct-of-arrays views of the words if not supplied."""
+        n_words = len(self.words)
+        if self.bboxes is None:
+            self.bboxes = np.fromiter(
+                (c for word in self.words for c in word.bbox),
+                dtype=np.int32,
+                count=4 * n_words
+            ).reshape(-1, 4)
+        if self.confidences is None:
+            self.confidences = np.fromiter(
+                (word.confidence for word in self.words),
+                dtype=np.float64,
+                count=n_words
+            )
+        if self.line_ids is None:
+            self.line_ids = np.fromiter(
+                (word.line_index for word in self.words),
+                dtype=np.int32,
+                count=n_words
+            )
+    
+    @cached_property
     def text(self) -> str:
         """
         Get the full text content.
         
+        Computed once and cached, like the other derived values.
+        
         Returns:
             All text joined with newlines between lines.
         """
@@ -204,12 +288,31 @@ class OCRResult:
         """Get total number of lines."""
         return len(self.lines)
     
-    @property
+    @cached_property
     def average_confidence(self) -> float:
-        """Calculate average confidence across all words."""
+        """Calculate average confidence across all words (cached)."""
         if not self.words:
             return 0.0
-        return sum(w.confidence for w in self.words) / len(self.words)
+        return float(self.confidences.mean())
+    
+    @cached_property
+    def widths(self) -> np.ndarray:
+        """
+        Widths of all word boxes in pixels, as one (N,) array (cached).
+    
+        Prefer this over per-word ``OCRWord.width`` in layout loops.
+        """
+        return self.bboxes[:, 2] - self.bboxes[:, 0]
+    
+    @cached_property
+    def heights(self) -> np.ndarray:
+        """Heights of all word boxes in pixels, as one (N,) array (cached)."""
+        return self.bboxes[:, 3] - self.bboxes[:, 1]
+    
+    @cached_property
+    def centers(self) -> np.ndarray:
+        """Center points of all word boxes, as an (N, 2) array (cached)."""
+        return (self.bboxes[:, :2] + self.bboxes[:, 2:]) // 2
     
     def get_words_as_list(self) -> List[str]:
         """Get list of word texts only."""
@@ -217,10 +320,12 @@ class OCRResult:
     
     def get_bboxes_as_list(self) -> List[List[int]]:
         """Get list of bounding boxes only."""
-        return [list(word.bbox) for word in self.words]
+        return self.bboxes.tolist()
     
     def get_normalized_bboxes(self) -> List[List[int]]:
         """Get list of normalized bounding boxes."""
+        if self.normalized_bboxes is not None:
+            return self.normalized_bboxes.tolist()
         return [
             list(word.normalized_bbox) if word.normalized_bbox else [0, 0, 0, 0]
             for word in self.words
@@ -239,19 +344,29 @@ class OCRResult:
         if self.image_width == 0 or self.image_height == 0:
             return
         
-        for word in self.words:
-            x1 = int(word.x1 * scale / self.image_width)
-            y1 = int(word.y1 * scale / self.image_height)
-            x2 = int(word.x2 * scale / self.image_width)
-            y2 = int(word.y2 * scale / self.image_height)
-            
-            # Clamp to valid range
-            x1 = max(0, min(scale, x1))
-            y1 = max(0, min(scale, y1))
-            x2 = max(0, min(scale, x2))
-            y2 = max(0, min(scale, y2))
-            
-            word.normalized_bbox = (x1, y1, x2, y2)
+        if not self.words:
+            return
+        
+        # Scale/clamp the (N, 4) box array in one pass
+        if NUMBA_AVAILABLE and len(self.words) >= NUMBA_MIN_WORDS:
+            normalized = np.empty_like(self.bboxes, dtype=np.int32)
+            _normalize_kernel(
+                np.ascontiguousarray(self.bboxes, dtype=np.int32),
+                self.image_width, self.image_height, scale, normalized
+            )
+        else:
+            scaler = np.array(
+                [self.image_width, self.image_height] * 2,
+                dtype=np.int64
+            )
+            normalized = np.clip(
+                (self.bboxes.astype(np.int64) * scale) // scaler, 0, scale
+            ).astype(np.int32)
+        self.normalized_bboxes = normalized
+        self._layoutlm_cache = None
+        
+        for word, row in zip(self.words, normalized.tolist()):
+            word.normalized_bbox = tuple(row)
     
     def filter_by_confidence(self, min_confidence: float) -> 'OCRResult':
         """
@@ -263,10 +378,18 @@ class OCRResult:
         Returns:
             New OCRResult with filtered words.
         """
-        filtered_words = [w for w in self.words if w.confidence >= min_confidence]
+        mask = self.confidences >= min_confidence
+        filtered_words = [self.words[i] for i in np.flatnonzero(mask).tolist()]
         
         return OCRResult(
             words=filtered_words,
+            bboxes=self.bboxes[mask],
+            confidences=self.confidences[mask],
+            line_ids=self.line_ids[mask],
+            normalized_bboxes=(
+                self.normalized_bboxes[mask]
+                if self.normalized_bboxes is not None else None
+            ),
             lines=[],  # Lines would need to be reconstructed
             image_width=self.image_width,
             image_height=self.image_height,
@@ -294,24 +417,71 @@ class OCRResult:
         }
     
     def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        """
+        Convert to JSON string.
+        
+        Uses orjson when installed and ``indent`` is 2 or None (the
+        layouts orjson supports), otherwise the standard json module.
+        """
+        data = self.to_dict()
+        
+        if ORJSON_AVAILABLE and indent in (None, 2):
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, option=option).decode('utf-8')
+            except TypeError:
+                pass  # Unsupported metadata type; let json handle/raise
+        
+        return json.dumps(data, indent=indent)
     
     def to_layoutlm_format(self) -> Dict[str, Any]:
         """
         Convert to format expected by LayoutLM models.
         
+        The result is cached until the boxes are re-normalized, so
+        repeated calls don't rebuild the lists.
+        
         Returns:
             Dictionary with 'words' and 'boxes' keys.
         """
+        if self._layoutlm_cache is not None:
+            return self._layoutlm_cache
+        
         # Ensure bboxes are normalized
-        if not self.words or self.words[0].normalized_bbox is None:
+        if self.normalized_bboxes is None:
             self.normalize_bboxes()
         
-        return {
-            'words': [word.text for word in self.words],
-            'boxes': [list(word.normalized_bbox) for word in self.words]
+        if self.normalized_bboxes is not None:
+            boxes = self.normalized_bboxes.tolist()
+        else:
+            boxes = [list(word.normalized_bbox) for word in self.words]
+        
+        self._layoutlm_cache = {
+            'words': self.get_words_as_list(),
+            'boxes': boxes
         }
+        return self._layoutlm_cache
+    
+    def to_layoutlm_arrays(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get LayoutLM inputs without building per-word box lists.
+        
+        The boxes array can be handed to ``torch.from_numpy`` without a
+        copy, avoiding the slow list-of-lists tensor conversion.
+        
+        Returns:
+            Tuple of (word texts, (N, 4) int32 normalized boxes).
+        """
+        if self.normalized_bboxes is None:
+            self.normalize_bboxes()
+        
+        boxes = self.normalized_bboxes
+        if boxes is None:
+            boxes = np.zeros((len(self.words), 4), dtype=np.int32)
+        
+        return self.get_words_as_list(), boxes
     
     def is_empty(self) -> bool:
         """Check if OCR result is empty."""
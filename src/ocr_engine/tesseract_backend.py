@@ -17,20 +17,174 @@ Requirements:
 Author: ML Engineering Team
 """
 
+import os
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Deque, Union
 from PIL import Image
 import re
 
+import numpy as np
+
 from config import get_config
 from src.utils.logger import get_logger
 from src.utils.exceptions import OCREngineNotAvailableError, OCRProcessingError
 from .ocr_result import OCRResult, OCRWord, OCRLine
+from .ocr_cache import OCRCache
 
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Numba is optional; when available, large pages are filtered with a
+# compiled loop instead of NumPy temporaries
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum TSV row count before the Numba kernel is preferred over NumPy
+NUMBA_MIN_ROWS = 1000
+
+# pytesseract module imported once per batch worker process
+_worker_pytesseract = None
+
+# Resolution hint in the Tesseract config, rescaled for downscaled pages
+_DPI_HINT_RE = re.compile(r'--dpi\s+(\d+)')
+
+
+def _init_batch_worker() -> None:
+    """Import pytesseract once when a batch worker process starts."""
+    global _worker_pytesseract
+    import pytesseract
+    _worker_pytesseract = pytesseract
+
+
+def _batch_image_to_data(
+    image: Image.Image,
+    language: str,
+    config: str
+) -> str:
+    """Run ``image_to_data`` inside a batch worker process (raw TSV)."""
+    return _worker_pytesseract.image_to_data(
+        image,
+        lang=language,
+        config=config,
+        output_type=_worker_pytesseract.Output.STRING
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _filter_and_pack(lefts, tops, widths, heights, confs, line_nums, has_text, scale):
+        """Filter TSV rows and pack boxes, confidences and lines in one pass."""
+        n = lefts.shape[0]
+        keep = np.empty(n, dtype=np.int64)
+        count = 0
+        for i in range(n):
+            if has_text[i] and widths[i] > 0 and heights[i] > 0:
+                keep[count] = i
+                count += 1
+        keep = keep[:count]
+        
+        bboxes = np.empty((count, 4), dtype=np.int32)
+        kept_confs = np.empty(count, dtype=np.float64)
+        kept_lines = np.empty(count, dtype=np.int32)
+        for j in range(count):
+            i = keep[j]
+            bboxes[j, 0] = lefts[i] * scale
+            bboxes[j, 1] = tops[i] * scale
+            bboxes[j, 2] = (lefts[i] + widths[i]) * scale
+            bboxes[j, 3] = (tops[i] + heights[i]) * scale
+            kept_confs[j] = confs[i] if confs[i] > 0.0 else 0.0
+            kept_lines[j] = line_nums[i]
+        
+        return keep, bboxes, kept_confs, kept_lines
+
+
+def _scale_dpi_hint(config: str, factor: int) -> str:
+    """
+    Divide the ``--dpi`` value in a Tesseract config by a downscale factor.
+    
+    Args:
+        config: Tesseract configuration string.
+        factor: Factor the image was downscaled by.
+        
+    Returns:
+        Config with the resolution hint matching the downscaled image.
+    """
+    if factor == 1:
+        return config
+    return _DPI_HINT_RE.sub(
+        lambda match: f"--dpi {max(1, int(match.group(1)) // factor)}", config
+    )
+
+
+def _tsv_to_columns(tsv: str) -> Dict[str, List[str]]:
+    """
+    Split Tesseract TSV output into string columns.
+    
+    The numeric columns are left as strings and converted in bulk by
+    NumPy, instead of one ``int()`` call per cell.
+    
+    Args:
+        tsv: Raw ``image_to_data`` TSV output with header row.
+        
+    Returns:
+        Dictionary mapping column names to lists of cell strings.
+    """
+    lines = tsv.splitlines()
+    if not lines:
+        return {'text': [], 'left': [], 'top': [], 'width': [],
+                'height': [], 'conf': [], 'line_num': []}
+    
+    header = lines[0].split('\t')
+    n_cols = len(header)
+    
+    rows = []
+    for line in lines[1:]:
+        cells = line.split('\t')
+        if len(cells) < n_cols:
+            cells.extend([''] * (n_cols - len(cells)))
+        rows.append(cells)
+    
+    columns = list(zip(*rows)) if rows else [()] * n_cols
+    return {name: list(column) for name, column in zip(header, columns)}
+
+
+def _to_ocr_mode(image: Image.Image, target_mode: str) -> Image.Image:
+    """
+    Convert an image to ``target_mode`` ('L' or 'RGB') for OCR.
+    
+    Images with an alpha channel are flattened onto a white background
+    (a plain convert would drop alpha and leave transparent areas in
+    whatever color the hidden pixels have, often black).
+    
+    Args:
+        image: PIL Image in any mode.
+        target_mode: Mode expected by Tesseract.
+        
+    Returns:
+        Image in ``target_mode`` (the input itself if already there).
+    """
+    if image.mode == target_mode:
+        return image
+    
+    if image.mode in ('RGBA', 'LA') or (
+        image.mode == 'P' and 'transparency' in image.info
+    ):
+        alpha_mode = 'LA' if target_mode == 'L' else 'RGBA'
+        if image.mode != alpha_mode:
+            image = image.convert(alpha_mode)
+        white = 255 if target_mode == 'L' else (255, 255, 255)
+        background = Image.new(target_mode, image.size, white)
+        background.paste(image.convert(target_mode), mask=image.getchannel('A'))
+        return background
+    
+    return image.convert(target_mode)
+
 
 class TesseractBackend:
     """
@@ -60,6 +214,31 @@ class TesseractBackend:
         self.extra_config = get_config("ocr.tesseract.config", "")
         self.normalize_scale = get_config("ocr.bbox.scale_factor", 1000)
         
+        # Tesseract binarizes a grayscale copy of RGB input anyway, so
+        # sending 'L' images cuts the data handed to it by two thirds
+        self.grayscale_input = get_config("ocr.tesseract.grayscale_input", True)
+        
+        # Larger inputs are downscaled before OCR (None = never)
+        # (the default keeps A4 pages rendered at 300 DPI, 2480x3508, at
+        # full resolution)
+        self.max_dimension = get_config("ocr.tesseract.max_dimension", 4000)
+        
+        # Optional on-disk cache of results keyed by image content
+        self._cache: Optional[OCRCache] = None
+        if get_config("ocr.cache.enabled", False):
+            cache_dir = get_config("ocr.cache.dir", None) or (
+                Path(get_config("paths.temp_dir", "data/temp")) / "ocr_cache"
+            )
+            self._cache = OCRCache(cache_dir)
+        
+        # Worker processes for extract_many (None = CPU count); the pool
+        # is created on first use and kept until close()
+        self.batch_workers = get_config("ocr.batch.workers", None)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Installed languages, looked up on first request
+        self._languages: Optional[List[str]] = None
+        
         # Check for pytesseract
         self._check_dependencies()
         
@@ -79,9 +258,10 @@ class TesseractBackend:
             import pytesseract
             self._pytesseract = pytesseract
             
-            # Test Tesseract is accessible
-            version = pytesseract.get_tesseract_version()
-            logger.info(f"Tesseract version: {version}")
+            # Test Tesseract is accessible; keep the version for metadata
+            # (each get_tesseract_version() call spawns a subprocess)
+            self._tesseract_version = str(pytesseract.get_tesseract_version())
+            logger.info(f"Tesseract version: {self._tesseract_version}")
             
         except ImportError:
             raise OCREngineNotAvailableError(
@@ -109,6 +289,38 @@ class TesseractBackend:
         
         return ' '.join(config_parts)
     
+    def _prepare_image(self, image: Image.Image) -> Tuple[Image.Image, int]:
+        """
+        Convert an image to the mode and size sent to Tesseract.
+        
+        Images whose longer side exceeds ``ocr.tesseract.max_dimension``
+        are shrunk by a power-of-two factor with ``Image.reduce`` (box
+        averaging); accuracy no longer improves at that resolution while
+        OCR time keeps growing with the pixel count. Callers should pass
+        the factor to _scale_dpi_hint() so Tesseract's ``--dpi`` hint
+        matches the reduced image.
+        
+        Args:
+            image: PIL Image to convert.
+            
+        Returns:
+            Tuple of (grayscale 'L' image, or RGB if grayscale input is
+            disabled; downscale factor to map boxes back to input pixels).
+        """
+        target_mode = 'L' if self.grayscale_input else 'RGB'
+        
+        factor = 1
+        if self.max_dimension:
+            while max(image.size) // factor > self.max_dimension:
+                factor *= 2
+        
+        if factor > 1:
+            if image.mode not in ('L', 'RGB', 'LA', 'RGBA'):
+                image = _to_ocr_mode(image, target_mode)
+            image = image.reduce(factor)
+        
+        return _to_ocr_mode(image, target_mode), factor
+    
     def extract(self, image: Image.Image) -> OCRResult:
         """
         Extract text and bounding boxes from an image.
@@ -125,60 +337,37 @@ class TesseractBackend:
         start_time = time.time()
         
         try:
-            # Ensure image is in correct format
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
             # Get image dimensions
             image_width, image_height = image.size
             
+            # Ensure image is in correct format and size
+            image, scale = self._prepare_image(image)
+            
             # Build config
-            config = self._build_config()
+            config = _scale_dpi_hint(self._build_config(), scale)
+            
+            # Return a cached result for an identical image/config
+            cache_key, cached = self._cache_lookup(image, config)
+            if cached is not None:
+                return cached
             
             # Extract data using Tesseract
             logger.debug(f"Running Tesseract OCR (config: {config})")
             
-            data = self._pytesseract.image_to_data(
+            tsv = self._pytesseract.image_to_data(
                 image,
                 lang=self.language,
                 config=config,
-                output_type=self._pytesseract.Output.DICT
+                output_type=self._pytesseract.Output.STRING
             )
+            data = _tsv_to_columns(tsv)
             
-            # Parse Tesseract output
-            words = self._parse_tesseract_output(data)
-            
-            # Group words into lines
-            lines = self._group_into_lines(words)
-            
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Create result
-            result = OCRResult(
-                words=words,
-                lines=lines,
-                image_width=image_width,
-                image_height=image_height,
-                language=self.language,
-                engine="tesseract",
-                processing_time=processing_time,
-                metadata={
-                    'psm': self.psm,
-                    'oem': self.oem,
-                    'tesseract_version': str(self._pytesseract.get_tesseract_version())
-                }
+            result = self._build_result(
+                data, image_width, image_height, time.time() - start_time, scale
             )
             
-            # Normalize bounding boxes
-            result.normalize_bboxes(self.normalize_scale)
-            
-            logger.info(
-                f"OCR completed: {result.word_count} words, "
-                f"{result.line_count} lines, "
-                f"avg confidence: {result.average_confidence:.1f}% "
-                f"({processing_time:.2f}s)"
-            )
+            if cache_key is not None:
+                self._cache.put(cache_key, result)
             
             return result
             
@@ -186,77 +375,329 @@ class TesseractBackend:
             logger.error(f"OCR processing failed: {e}")
             raise OCRProcessingError("image", str(e))
     
-    def _parse_tesseract_output(self, data: Dict[str, List]) -> List[OCRWord]:
+    def extract_many(self, images: List[Image.Image]) -> List[OCRResult]:
+        """
+        Extract text from several images in parallel worker processes.
+        
+        Each Tesseract call is single-threaded, so pages are spread over
+        a pool of worker processes. The pool is created on first use and
+        reused by later calls; output parsing stays in this process.
+        
+        Args:
+            images: List of PIL Images.
+            
+        Returns:
+            List of OCRResult objects, in input order.
+            
+        Raises:
+            OCRProcessingError: If OCR fails for any image.
+        """
+        if len(images) <= 1:
+            return [self.extract(image) for image in images]
+        
+        start_time = time.time()
+        config = self._build_config()
+        
+        try:
+            prepared = [self._prepare_image(image) for image in images]
+            
+            # Serve cached pages first; only the misses go to the pool
+            results: List[Optional[OCRResult]] = []
+            cache_keys: List[Optional[str]] = []
+            for ocr_image, scale in prepared:
+                cache_key, cached = self._cache_lookup(
+                    ocr_image, _scale_dpi_hint(config, scale)
+                )
+                results.append(cached)
+                cache_keys.append(cache_key)
+            
+            pool = self._get_pool() if None in results else None
+            futures = {
+                i: pool.submit(
+                    _batch_image_to_data, ocr_image, self.language,
+                    _scale_dpi_hint(config, scale)
+                )
+                for i, (ocr_image, scale) in enumerate(prepared)
+                if results[i] is None
+            }
+            
+            logger.debug(f"Running Tesseract OCR on {len(futures)} images (config: {config})")
+            
+            for i, future in futures.items():
+                image = images[i]
+                data = _tsv_to_columns(future.result())
+                results[i] = self._build_result(
+                    data, image.width, image.height,
+                    (time.time() - start_time) / len(futures), prepared[i][1]
+                )
+                if cache_keys[i] is not None:
+                    self._cache.put(cache_keys[i], results[i])
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch OCR processing failed: {e}")
+            raise OCRProcessingError("batch", str(e))
+    
+    def extract_iter(
+        self,
+        images: Iterable[Image.Image],
+        prefetch: int = 2
+    ) -> Iterator[OCRResult]:
+        """
+        Extract text from a stream of images, overlapping OCR with loading.
+        
+        OCR runs in the worker pool while this process pulls (and
+        decodes) the next images from ``images``; up to ``prefetch``
+        images are queued ahead of the one being waited on. Results are
+        yielded in input order.
+        
+        Args:
+            images: Iterable of PIL Images (may be a lazy generator).
+            prefetch: Number of images to queue ahead.
+            
+        Yields:
+            OCRResult for each image.
+            
+        Raises:
+            OCRProcessingError: If OCR fails for an image.
+        """
+        config = self._build_config()
+        pool = self._get_pool()
+        
+        # Cache hits are queued as finished results so output order is kept
+        pending: Deque[Union[OCRResult, Tuple[int, int, int, float, Future, Optional[str]]]] = deque()
+        
+        for image in images:
+            ocr_image, scale = self._prepare_image(image)
+            page_config = _scale_dpi_hint(config, scale)
+            cache_key, cached = self._cache_lookup(ocr_image, page_config)
+            if cached is not None:
+                pending.append(cached)
+            else:
+                pending.append((
+                    image.width, image.height, scale, time.time(),
+                    pool.submit(_batch_image_to_data, ocr_image, self.language, page_config),
+                    cache_key
+                ))
+            
+            if len(pending) > prefetch:
+                yield self._collect(pending.popleft())
+        
+        while pending:
+            yield self._collect(pending.popleft())
+    
+    def _collect(
+        self,
+        item: Union[OCRResult, Tuple[int, int, int, float, Future, Optional[str]]]
+    ) -> OCRResult:
+        """Wait for a queued worker call (or take a cache hit) and return its OCRResult."""
+        if isinstance(item, OCRResult):
+            return item
+        
+        image_width, image_height, scale, submitted_at, future, cache_key = item
+        try:
+            data = _tsv_to_columns(future.result())
+            result = self._build_result(
+                data, image_width, image_height,
+                time.time() - submitted_at, scale
+            )
+        except Exception as e:
+            logger.error(f"OCR processing failed: {e}")
+            raise OCRProcessingError("image", str(e))
+        
+        if cache_key is not None:
+            self._cache.put(cache_key, result)
+        return result
+    
+    def _cache_lookup(
+        self,
+        image: Image.Image,
+        config: str
+    ) -> Tuple[Optional[str], Optional[OCRResult]]:
+        """
+        Look up a prepared image in the OCR cache.
+        
+        Args:
+            image: Image exactly as it will be sent to Tesseract.
+            config: Tesseract config used for it.
+            
+        Returns:
+            Tuple of (cache key, cached result); both None when caching
+            is disabled, and the result is None on a miss.
+        """
+        if self._cache is None:
+            return None, None
+        
+        cache_key = self._cache.make_key(
+            image, f"{config}|{self.language}|{self.normalize_scale}"
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"OCR cache hit: {cache_key}")
+        return cache_key, cached
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the batch worker pool, creating it on first use."""
+        if self._pool is None:
+            workers = self.batch_workers or os.cpu_count() or 1
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker
+            )
+            logger.debug(f"Started Tesseract worker pool ({workers} processes)")
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the batch worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def _build_result(
+        self,
+        data: Dict[str, List],
+        image_width: int,
+        image_height: int,
+        processing_time: float,
+        scale: int = 1
+    ) -> OCRResult:
+        """
+        Build an OCRResult from ``image_to_data`` output.
+        
+        Args:
+            data: Column dictionary from _tsv_to_columns.
+            image_width: Source image width in pixels.
+            image_height: Source image height in pixels.
+            processing_time: Time spent on OCR in seconds.
+            scale: Factor the image was downscaled by before OCR.
+            
+        Returns:
+            OCRResult with normalized bounding boxes.
+        """
+        # Parse Tesseract output (words plus their column arrays)
+        words, bboxes, confidences, line_ids = self._parse_tesseract_output(data, scale)
+        
+        # Group words into lines
+        lines = self._group_into_lines(words, bboxes, line_ids)
+        
+        # Create result
+        result = OCRResult(
+            words=words,
+            lines=lines,
+            image_width=image_width,
+            image_height=image_height,
+            language=self.language,
+            engine="tesseract",
+            bboxes=bboxes,
+            confidences=confidences,
+            line_ids=line_ids,
+            processing_time=processing_time,
+            metadata={
+                'psm': self.psm,
+                'oem': self.oem,
+                'tesseract_version': self._tesseract_version
+            }
+        )
+        
+        # Normalize bounding boxes
+        result.normalize_bboxes(self.normalize_scale)
+        
+        logger.info(
+            f"OCR completed: {result.word_count} words, "
+            f"{result.line_count} lines, "
+            f"avg confidence: {result.average_confidence:.1f}% "
+            f"({processing_time:.2f}s)"
+        )
+        
+        return result
+    
+    def _parse_tesseract_output(
+        self,
+        data: Dict[str, List],
+        scale: int = 1
+    ) -> Tuple[List[OCRWord], np.ndarray, np.ndarray, np.ndarray]:
         """
         Parse Tesseract output into OCRWord objects.
         
+        The filtered columns are also returned as arrays so the result
+        can take them as its struct-of-arrays fields directly.
+        
         Args:
-            data: Dictionary output from image_to_data.
+            data: Column dictionary from _tsv_to_columns.
+            scale: Multiplier mapping box coordinates back to the
+                source image (the downscale factor).
             
         Returns:
-            List of OCRWord objects.
+            Tuple of (words, (N, 4) int32 bboxes, (N,) float64
+            confidences, (N,) int32 line indices).
         """
-        words = []
-        word_index = 0
-        
-        n_boxes = len(data['text'])
-        
-        for i in range(n_boxes):
-            text = data['text'][i]
-            
-            # Skip empty text
-            if not text or not text.strip():
-                continue
-            
-            # Clean text
-            text = text.strip()
-            
-            # Get bounding box
-            x = data['left'][i]
-            y = data['top'][i]
-            w = data['width'][i]
-            h = data['height'][i]
-            
-            # Skip invalid boxes
-            if w <= 0 or h <= 0:
-                continue
-            
-            # Calculate box coordinates
-            x1 = x
-            y1 = y
-            x2 = x + w
-            y2 = y + h
-            
-            # Get confidence
-            conf = float(data['conf'][i])
-            if conf < 0:
-                conf = 0.0  # Tesseract returns -1 for some elements
-            
-            # Get line/block info
-            block_num = data['block_num'][i]
-            par_num = data['par_num'][i]
-            line_num = data['line_num'][i]
-            
-            # Create word object
-            word = OCRWord(
-                text=text,
-                bbox=(x1, y1, x2, y2),
+        # Filter all rows at once with column-wise masks
+        texts = [text.strip() if text else '' for text in data['text']]
+        lefts = np.asarray(data['left'], dtype=np.int32)
+        tops = np.asarray(data['top'], dtype=np.int32)
+        widths = np.asarray(data['width'], dtype=np.int32)
+        heights = np.asarray(data['height'], dtype=np.int32)
+        
+        confs = np.asarray(data['conf'], dtype=np.float64)
+        line_nums = np.asarray(data['line_num'], dtype=np.int32)
+        has_text = np.fromiter(
+            (bool(text) for text in texts), dtype=bool, count=len(texts)
+        )
+        
+        if NUMBA_AVAILABLE and len(texts) >= NUMBA_MIN_ROWS:
+            keep, bboxes, confs, line_nums = _filter_and_pack(
+                lefts, tops, widths, heights, confs, line_nums, has_text, scale
+            )
+        else:
+            # Skip empty text and invalid boxes
+            keep = np.flatnonzero((widths > 0) & (heights > 0) & has_text)
+            
+            # Tesseract returns -1 confidence for some elements
+            confs = confs[keep]
+            confs = np.where(confs < 0, 0.0, confs)
+            
+            x1 = lefts[keep]
+            y1 = tops[keep]
+            bboxes = np.stack(
+                [x1, y1, x1 + widths[keep], y1 + heights[keep]], axis=1
+            )
+            if scale != 1:
+                bboxes *= scale
+            line_nums = line_nums[keep]
+        
+        # Build word objects only for surviving rows
+        words = [None] * len(keep)
+        for word_index, (i, bbox, conf, line_num) in enumerate(zip(
+            keep.tolist(), bboxes.tolist(), confs.tolist(), line_nums.tolist()
+        )):
+            words[word_index] = OCRWord(
+                text=texts[i],
+                bbox=tuple(bbox),
                 confidence=conf,
                 word_index=word_index,
                 line_index=line_num
             )
-            
-            words.append(word)
-            word_index += 1
         
-        return words
+        return words, bboxes, confs, line_nums
     
-    def _group_into_lines(self, words: List[OCRWord]) -> List[OCRLine]:
+    def _group_into_lines(
+        self,
+        words: List[OCRWord],
+        bboxes: Optional[np.ndarray] = None,
+        line_ids: Optional[np.ndarray] = None
+    ) -> List[OCRLine]:
         """
         Group words into lines based on vertical position.
         
+        Words are ordered by (line, x1) with one lexsort, and all line
+        boxes are computed with a single min/max ``reduceat`` over the
+        sorted (N, 4) box array.
+        
         Args:
             words: List of OCRWord objects.
+            bboxes: Optional (N, 4) box array parallel to ``words``.
+            line_ids: Optional (N,) line index array parallel to ``words``.
             
         Returns:
             List of OCRLine objects.
@@ -264,30 +705,35 @@ class TesseractBackend:
         if not words:
             return []
         
-        # Group by line_index assigned by Tesseract
-        line_groups: Dict[int, List[OCRWord]] = {}
+        if bboxes is None:
+            bboxes = np.array([word.bbox for word in words], dtype=np.int32)
+        if line_ids is None:
+            line_ids = np.array([word.line_index for word in words], dtype=np.int32)
+        
+        # Group by line_index assigned by Tesseract, words by x position
+        order = np.lexsort((bboxes[:, 0], line_ids))
+        sorted_lines = line_ids[order]
+        sorted_boxes = bboxes[order]
         
-        for word in words:
-            line_idx = word.line_index
-            if line_idx not in line_groups:
-                line_groups[line_idx] = []
-            line_groups[line_idx].append(word)
+        starts = np.flatnonzero(np.r_[True, sorted_lines[1:] != sorted_lines[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        
+        mins = np.minimum.reduceat(sorted_boxes[:, :2], starts, axis=0)
+        maxs = np.maximum.reduceat(sorted_boxes[:, 2:], starts, axis=0)
+        line_boxes = np.concatenate([mins, maxs], axis=1).tolist()
         
         # Create line objects
+        order = order.tolist()
         lines = []
-        for line_idx in sorted(line_groups.keys()):
-            line_words = line_groups[line_idx]
-            
-            # Sort words by x position
-            line_words.sort(key=lambda w: w.x1)
-            
-            line = OCRLine(
-                words=line_words,
+        for start, end, line_idx, bbox in zip(
+            starts.tolist(), ends.tolist(),
+            sorted_lines[starts].tolist(), line_boxes
+        ):
+            lines.append(OCRLine(
+                words=[words[i] for i in order[start:end]],
+                bbox=tuple(bbox),
                 line_index=line_idx
-            )
-            line.compute_bbox()
-            
-            lines.append(line)
+            ))
         
         return lines
     
@@ -351,9 +797,13 @@ class TesseractBackend:
         Returns:
             List of language codes.
         """
+        if self._languages is not None:
+            return list(self._languages)
+        
         try:
             langs = self._pytesseract.get_languages()
-            return [l for l in langs if l != 'osd']
+            self._languages = [l for l in langs if l != 'osd']
+            return list(self._languages)
         except Exception as e:
             logger.debug(f"Could not get languages: {e}")
             return ['eng']
@@ -14,7 +14,10 @@ Author: ML Engineering Team
 """
 
 import os
+import re
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
@@ -27,6 +30,31 @@ from src.model_inference.extraction_result import ExtractionResult
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Everything except digits, sign and decimal point (currency, commas, spaces)
+_AMOUNT_STRIP_PATTERN = re.compile(r'[^0-9.\-]')
+
+
+def _parse_amount(value: Any) -> Optional[float]:
+    """
+    Parse an amount for storage, tolerating currency symbols and commas.
+    
+    Args:
+        value: Amount string (e.g. "$1,234.56") or number.
+        
+    Returns:
+        Float value, or None if no number can be read.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    
+    cleaned = _AMOUNT_STRIP_PATTERN.sub('', str(value))
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
 
 class DatabaseHandler:
     """
@@ -39,6 +67,10 @@ class DatabaseHandler:
         db_path: Path to the SQLite database file
         table_name: Name of the main table
         engine: SQLAlchemy engine instance
+    
+    A single connection (WAL journal mode) is opened in ``__init__`` and
+    shared by all methods; access is serialized with a lock so the
+    handler can be used from several threads. Call ``close()`` when done.
         
     Example:
         >>> db = DatabaseHandler()
@@ -62,14 +94,54 @@ class DatabaseHandler:
             self.db_path = output_dir / db_name
         
         self.table_name = get_config("output.database.table_name", "invoice_headers")
+        self._fts_table = f"{self.table_name}_fts"
         self.avoid_duplicates = get_config("output.database.avoid_duplicates", True)
         self.create_if_not_exists = get_config("output.database.create_if_not_exists", True)
         
+        # Statements built once and reused; sqlite3 caches the prepared
+        # statement per connection by SQL text
+        table = self.table_name
+        columns = """
+                invoice_number, invoice_date, vendor_name, customer_name,
+                total_amount, payment_due_date, source_file, extraction_timestamp,
+                model_name, processing_time, success, extraction_rate,
+                average_confidence, invoice_number_confidence, invoice_date_confidence,
+                vendor_name_confidence, customer_name_confidence,
+                total_amount_confidence, payment_due_date_confidence
+        """
+        placeholders = ", ".join("?" * 19)
+        if self.avoid_duplicates:
+            # Besides the (invoice_number, vendor_name) UNIQUE key, a row
+            # without a vendor is skipped when its invoice number already
+            # exists under any vendor; takes 3 extra parameters, see
+            # _insert_values()
+            insert_sql = f"""
+            INSERT OR IGNORE INTO {table} ({columns})
+            SELECT {placeholders}
+            WHERE ? = '' OR ? <> ''
+                OR NOT EXISTS (SELECT 1 FROM {table} WHERE invoice_number = ?)
+            """
+        else:
+            # The table's UNIQUE ... ON CONFLICT IGNORE still drops exact
+            # (invoice_number, vendor_name) repeats
+            insert_sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        
+        self._SQL = SimpleNamespace(
+            insert=insert_sql,
+            exists_pair=f"SELECT 1 FROM {table} WHERE invoice_number = ? AND vendor_name = ? LIMIT 1",
+            exists_one=f"SELECT 1 FROM {table} WHERE invoice_number = ? LIMIT 1",
+            get_by_num=f"SELECT * FROM {table} WHERE invoice_number = ? LIMIT 1",
+            count=f"SELECT COUNT(*) FROM {table}",
+            delete=f"DELETE FROM {table} WHERE invoice_number = ?"
+        )
+        
         # Ensure directory exists
         ensure_directory(self.db_path.parent)
         
         # Check dependencies and initialize
         self._check_dependencies()
+        self._lock = threading.Lock()
+        self._conn = None
         self._initialize_database()
         
         logger.info(f"DatabaseHandler initialized (db: {self.db_path})")
@@ -100,9 +172,33 @@ class DatabaseHandler:
                 f"Database does not exist: {self.db_path}"
             )
         
+        self._conn = self._connect()
+        
         # Create tables
         self._create_tables()
     
+    def _connect(self):
+        """
+        Open the shared connection and apply performance pragmas.
+        
+        Returns:
+            sqlite3 connection in autocommit mode with Row results.
+        """
+        try:
+            conn = self._sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            conn.row_factory = self._sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            return conn
+        except Exception as e:
+            raise DatabaseError("connect", str(e))
+    
     def _create_tables(self) -> None:
         """Create the required database tables."""
         create_sql = f"""
@@ -112,7 +208,7 @@ class DatabaseHandler:
             invoice_date TEXT,
             vendor_name TEXT,
             customer_name TEXT,
-            total_amount TEXT,
+            total_amount REAL,
             payment_due_date TEXT,
             source_file TEXT,
             extraction_timestamp TEXT,
@@ -133,28 +229,156 @@ class DatabaseHandler:
         """
         
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(create_sql)
-            
-            # Create index for faster lookups
-            cursor.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_invoice_number 
-                ON {self.table_name} (invoice_number)
-            """)
-            
-            cursor.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_vendor_name 
-                ON {self.table_name} (vendor_name)
-            """)
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+                
+                # Databases created before total_amount became REAL
+                if self._column_type(cursor, 'total_amount') == 'TEXT':
+                    self._migrate_v2(cursor, create_sql)
+                
+                cursor.execute(create_sql)
+                
+                # Create index for faster lookups
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_invoice_number 
+                    ON {self.table_name} (invoice_number)
+                """)
+                
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_vendor_name 
+                    ON {self.table_name} (vendor_name)
+                """)
+                
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_total_amount 
+                    ON {self.table_name} (total_amount)
+                """)
             
             logger.debug(f"Database tables created/verified")
             
         except Exception as e:
             raise DatabaseError("create tables", str(e))
+        
+        self._fts_available = self._create_fts_index()
+    
+    def _column_type(self, cursor, column: str) -> Optional[str]:
+        """Return the declared type of a column, or None if absent."""
+        cursor.execute(f"PRAGMA table_info({self.table_name})")
+        for row in cursor.fetchall():
+            if row['name'] == column:
+                return row['type'].upper()
+        return None
+    
+    def _migrate_v2(self, cursor, create_sql: str) -> None:
+        """
+        Rebuild the table with ``total_amount`` stored as REAL.
+        
+        Existing text amounts are parsed with ``_parse_amount``; values
+        that cannot be parsed become NULL. The FTS index and its
+        triggers are dropped and recreated (and rebuilt) afterwards.
+        
+        Args:
+            cursor: Cursor on the shared connection (lock held).
+            create_sql: CREATE TABLE statement for the new schema.
+        """
+        table = self.table_name
+        old_table = f"{table}_v1"
+        fts = self._fts_table
+        
+        logger.info(f"Migrating {table}: storing total_amount as REAL")
+        
+        self._conn.create_function("parse_amount", 1, _parse_amount, deterministic=True)
+        
+        cursor.execute("BEGIN")
+        try:
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+            
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+            cursor.execute(create_sql)
+            
+            cursor.execute(f"PRAGMA table_info({old_table})")
+            columns = [row['name'] for row in cursor.fetchall()]
+            select = [
+                'parse_amount(total_amount)' if name == 'total_amount' else name
+                for name in columns
+            ]
+            
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(select)} FROM {old_table}"
+            )
+            cursor.execute(f"DROP TABLE {old_table}")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+    
+    def _create_fts_index(self) -> bool:
+        """
+        Create the FTS5 name index used by ``search``.
+        
+        Uses the trigram tokenizer so MATCH answers the same substring
+        queries as ``LIKE '%...%'`` without scanning the table. Triggers
+        keep the index in sync with the main table.
+        
+        Returns:
+            True if the index is available, False if this SQLite build
+            lacks FTS5/trigram support (search then falls back to LIKE).
+        """
+        table = self.table_name
+        fts = self._fts_table
+        
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (fts,)
+                )
+                is_new = cursor.fetchone() is None
+                
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                        vendor_name, customer_name, invoice_number,
+                        content='{table}', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                """)
+                
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                        INSERT INTO {fts} (rowid, vendor_name, customer_name, invoice_number)
+                        VALUES (new.id, new.vendor_name, new.customer_name, new.invoice_number);
+                    END
+                """)
+                
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                        INSERT INTO {fts} ({fts}, rowid, vendor_name, customer_name, invoice_number)
+                        VALUES ('delete', old.id, old.vendor_name, old.customer_name, old.invoice_number);
+                    END
+                """)
+                
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                        INSERT INTO {fts} ({fts}, rowid, vendor_name, customer_name, invoice_number)
+                        VALUES ('delete', old.id, old.vendor_name, old.customer_name, old.invoice_number);
+                        INSERT INTO {fts} (rowid, vendor_name, customer_name, invoice_number)
+                        VALUES (new.id, new.vendor_name, new.customer_name, new.invoice_number);
+                    END
+                """)
+                
+                # Index rows stored before the FTS table existed
+                if is_new:
+                    cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+            
+            return True
+            
+        except self._sqlite3.OperationalError as e:
+            logger.debug(f"FTS5 trigram index not available, using LIKE search: {e}")
+            return False
     
     def insert(self, result: ExtractionResult) -> bool:
         """
@@ -169,53 +393,18 @@ class DatabaseHandler:
         Raises:
             DatabaseError: If insertion fails.
         """
-        # Check for duplicates if enabled
-        if self.avoid_duplicates and result.invoice_number:
-            if self.exists(result.invoice_number, result.vendor_name):
+        values = self._insert_values(result)
+        
+        try:
+            with self._lock:
+                cursor = self._conn.execute(self._SQL.insert, values)
+            
+            # Duplicates are dropped by the insert statement itself
+            if cursor.rowcount == 0:
                 logger.debug(
                     f"Duplicate detected, skipping: {result.invoice_number}"
                 )
                 return False
-        
-        insert_sql = f"""
-        INSERT INTO {self.table_name} (
-            invoice_number, invoice_date, vendor_name, customer_name,
-            total_amount, payment_due_date, source_file, extraction_timestamp,
-            model_name, processing_time, success, extraction_rate,
-            average_confidence, invoice_number_confidence, invoice_date_confidence,
-            vendor_name_confidence, customer_name_confidence,
-            total_amount_confidence, payment_due_date_confidence
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
-        values = (
-            result.invoice_number or '',
-            result.invoice_date or '',
-            result.vendor_name or '',
-            result.customer_name or '',
-            result.total_amount or '',
-            result.payment_due_date or '',
-            result.source_file or '',
-            result.extraction_timestamp or datetime.now().isoformat(),
-            result.model_name or '',
-            result.processing_time,
-            1 if result.success else 0,
-            result.extraction_rate,
-            result.average_confidence,
-            result.confidence_scores.get('invoice_number', 0),
-            result.confidence_scores.get('invoice_date', 0),
-            result.confidence_scores.get('vendor_name', 0),
-            result.confidence_scores.get('customer_name', 0),
-            result.confidence_scores.get('total_amount', 0),
-            result.confidence_scores.get('payment_due_date', 0),
-        )
-        
-        try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(insert_sql, values)
-            conn.commit()
-            conn.close()
             
             logger.debug(f"Inserted record: {result.invoice_number}")
             return True
@@ -229,26 +418,93 @@ class DatabaseHandler:
     
     def insert_batch(self, results: List[ExtractionResult]) -> Dict[str, int]:
         """
-        Insert multiple extraction results.
+        Insert multiple extraction results in a single transaction.
+        
+        Rows are written with one ``executemany`` call; duplicates are
+        dropped by the insert statement (see __init__) rather than
+        checked row by row.
         
         Args:
             results: List of ExtractionResult objects.
             
         Returns:
             Dictionary with 'inserted' and 'skipped' counts.
+            
+        Raises:
+            DatabaseError: If insertion fails.
         """
-        inserted = 0
-        skipped = 0
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    cursor = self._conn.executemany(
+                        self._SQL.insert,
+                        (self._insert_values(result) for result in results)
+                    )
+                    inserted = max(cursor.rowcount, 0)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
         
-        for result in results:
-            if self.insert(result):
-                inserted += 1
-            else:
-                skipped += 1
+        except Exception as e:
+            raise DatabaseError("insert_batch", str(e))
+        
+        skipped = len(results) - inserted
         
         logger.info(f"Batch insert complete: {inserted} inserted, {skipped} skipped")
         return {'inserted': inserted, 'skipped': skipped}
     
+    def _insert_values(self, result: ExtractionResult) -> tuple:
+        """
+        Build the parameters for the insert statement.
+        
+        Args:
+            result: ExtractionResult to insert.
+            
+        Returns:
+            Row values, plus the duplicate-check parameters when
+            avoid_duplicates is enabled.
+        """
+        values = self._row_values(result)
+        if self.avoid_duplicates:
+            invoice_number, vendor_name = values[0], values[2]
+            return values + (invoice_number, vendor_name, invoice_number)
+        return values
+    
+    @staticmethod
+    def _row_values(result: ExtractionResult) -> tuple:
+        """
+        Build the insert parameters for one extraction result.
+        
+        Args:
+            result: ExtractionResult to convert.
+            
+        Returns:
+            Tuple of column values in insert order.
+        """
+        return (
+            result.invoice_number or '',
+            result.invoice_date or '',
+            result.vendor_name or '',
+            result.customer_name or '',
+            _parse_amount(result.total_amount),
+            result.payment_due_date or '',
+            result.source_file or '',
+            result.extraction_timestamp or datetime.now().isoformat(),
+            result.model_name or '',
+            result.processing_time,
+            1 if result.success else 0,
+            result.extraction_rate,
+            result.average_confidence,
+            result.confidence_scores.get('invoice_number', 0),
+            result.confidence_scores.get('invoice_date', 0),
+            result.confidence_scores.get('vendor_name', 0),
+            result.confidence_scores.get('customer_name', 0),
+            result.confidence_scores.get('total_amount', 0),
+            result.confidence_scores.get('payment_due_date', 0),
+        )
+    
     def exists(
         self,
         invoice_number: str,
@@ -264,27 +520,19 @@ class DatabaseHandler:
         Returns:
             True if record exists, False otherwise.
         """
+        # SELECT 1 ... LIMIT 1 stops at the first matching row
         if vendor_name:
-            query = f"""
-            SELECT COUNT(*) FROM {self.table_name}
-            WHERE invoice_number = ? AND vendor_name = ?
-            """
+            query = self._SQL.exists_pair
             params = (invoice_number, vendor_name)
         else:
-            query = f"""
-            SELECT COUNT(*) FROM {self.table_name}
-            WHERE invoice_number = ?
-            """
+            query = self._SQL.exists_one
             params = (invoice_number,)
         
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            count = cursor.fetchone()[0]
-            conn.close()
+            with self._lock:
+                row = self._conn.execute(query, params).fetchone()
             
-            return count > 0
+            return row is not None
             
         except Exception as e:
             logger.error(f"Existence check failed: {e}")
@@ -305,16 +553,10 @@ class DatabaseHandler:
             query += f" LIMIT {limit}"
         
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            conn.row_factory = self._sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query)
+            with self._lock:
+                rows = self._conn.execute(query).fetchall()
             
-            rows = cursor.fetchall()
-            results = [dict(row) for row in rows]
-            
-            conn.close()
-            return results
+            return [dict(row) for row in rows]
             
         except Exception as e:
             raise DatabaseError("get_all", str(e))
@@ -329,20 +571,11 @@ class DatabaseHandler:
         Returns:
             Record dictionary or None if not found.
         """
-        query = f"""
-        SELECT * FROM {self.table_name}
-        WHERE invoice_number = ?
-        LIMIT 1
-        """
-        
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            conn.row_factory = self._sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query, (invoice_number,))
-            
-            row = cursor.fetchone()
-            conn.close()
+            with self._lock:
+                row = self._conn.execute(
+                    self._SQL.get_by_num, (invoice_number,)
+                ).fetchone()
             
             return dict(row) if row else None
             
@@ -361,7 +594,8 @@ class DatabaseHandler:
         Search records with various filters.
         
         Args:
-            vendor_name: Filter by vendor name (partial match).
+            vendor_name: Filter by vendor name (partial match,
+                case-insensitive).
             date_from: Filter by invoice date (from).
             date_to: Filter by invoice date (to).
             min_amount: Filter by minimum total amount.
@@ -374,8 +608,16 @@ class DatabaseHandler:
         params = []
         
         if vendor_name:
-            conditions.append("vendor_name LIKE ?")
-            params.append(f"%{vendor_name}%")
+            # Trigram MATCH needs at least 3 characters
+            if self._fts_available and len(vendor_name) >= 3:
+                conditions.append(
+                    f"id IN (SELECT rowid FROM {self._fts_table} "
+                    f"WHERE vendor_name MATCH ?)"
+                )
+                params.append('"' + vendor_name.replace('"', '""') + '"')
+            else:
+                conditions.append("vendor_name LIKE ?")
+                params.append(f"%{vendor_name}%")
         
         if date_from:
             conditions.append("invoice_date >= ?")
@@ -386,11 +628,11 @@ class DatabaseHandler:
             params.append(date_to)
         
         if min_amount is not None:
-            conditions.append("CAST(total_amount AS REAL) >= ?")
+            conditions.append("total_amount >= ?")
             params.append(min_amount)
         
         if max_amount is not None:
-            conditions.append("CAST(total_amount AS REAL) <= ?")
+            conditions.append("total_amount <= ?")
             params.append(max_amount)
         
         query = f"SELECT * FROM {self.table_name}"
@@ -399,16 +641,10 @@ class DatabaseHandler:
         query += " ORDER BY invoice_date DESC"
         
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            conn.row_factory = self._sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            
-            rows = cursor.fetchall()
-            results = [dict(row) for row in rows]
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
             
-            conn.close()
-            return results
+            return [dict(row) for row in rows]
             
         except Exception as e:
             raise DatabaseError("search", str(e))
@@ -416,12 +652,8 @@ class DatabaseHandler:
     def get_count(self) -> int:
         """Get the total number of records in the database."""
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count
+            with self._lock:
+                return self._conn.execute(self._SQL.count).fetchone()[0]
         except Exception as e:
             raise DatabaseError("get_count", str(e))
     
@@ -435,42 +667,41 @@ class DatabaseHandler:
         stats = {}
         
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Total count
-            cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
-            stats['total_records'] = cursor.fetchone()[0]
-            
-            # Success rate
-            cursor.execute(f"""
-                SELECT 
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                    COUNT(*) as total
-                FROM {self.table_name}
-            """)
-            row = cursor.fetchone()
-            if row[1] > 0:
-                stats['success_rate'] = row[0] / row[1]
-            else:
-                stats['success_rate'] = 0
-            
-            # Average confidence
-            cursor.execute(f"""
-                SELECT AVG(average_confidence) 
-                FROM {self.table_name}
-                WHERE success = 1
-            """)
-            stats['avg_confidence'] = cursor.fetchone()[0] or 0
-            
-            # Unique vendors
-            cursor.execute(f"""
-                SELECT COUNT(DISTINCT vendor_name) 
-                FROM {self.table_name}
-            """)
-            stats['unique_vendors'] = cursor.fetchone()[0]
-            
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+                
+                # Total count
+                cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+                stats['total_records'] = cursor.fetchone()[0]
+                
+                # Success rate
+                cursor.execute(f"""
+                    SELECT 
+                        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+                        COUNT(*) as total
+                    FROM {self.table_name}
+                """)
+                row = cursor.fetchone()
+                if row[1] > 0:
+                    stats['success_rate'] = row[0] / row[1]
+                else:
+                    stats['success_rate'] = 0
+                
+                # Average confidence
+                cursor.execute(f"""
+                    SELECT AVG(average_confidence) 
+                    FROM {self.table_name}
+                    WHERE success = 1
+                """)
+                stats['avg_confidence'] = cursor.fetchone()[0] or 0
+                
+                # Unique vendors
+                cursor.execute(f"""
+                    SELECT COUNT(DISTINCT vendor_name) 
+                    FROM {self.table_name}
+                """)
+                stats['unique_vendors'] = cursor.fetchone()[0]
+            
             return stats
             
         except Exception as e:
@@ -488,15 +719,9 @@ class DatabaseHandler:
             True if deleted, False if not found.
         """
         try:
-            conn = self._sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                f"DELETE FROM {self.table_name} WHERE invoice_number = ?",
-                (invoice_number,)
-            )
-            deleted = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
+            with self._lock:
+                cursor = self._conn.execute(self._SQL.delete, (invoice_number,))
+                deleted = cursor.rowcount > 0
             
             if deleted:
                 logger.debug(f"Deleted record: {invoice_number}")
@@ -507,7 +732,8 @@ class DatabaseHandler:
             raise DatabaseError("delete", str(e))
     
     def close(self) -> None:
-        """Close any open database connections."""
-        # With sqlite3, connections are closed per-operation
-        # This method is for interface consistency
-        pass
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -9,12 +9,20 @@ Features:
     - Auto-column width
     - Metadata sheet
     - Multiple result support
+    - Streaming (write-only) workbook output
+    - Plain CSV export for large batches
 
 Author: ML Engineering Team
 """
 
+import csv
+import io
+import os
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from types import SimpleNamespace
+from string import ascii_uppercase
+from typing import Any, Dict, Iterable, List, Optional, Union
 from datetime import datetime
 
 from config import get_config
@@ -26,6 +34,52 @@ from src.model_inference.extraction_result import ExtractionResult
 # Initialize module logger
 logger = get_logger(__name__)
 
+# xlsxwriter is optional; it backs the constant-memory path for large exports
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Buffer size for the final workbook write
+_WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# format() specs for numeric metadata columns
+_META_FORMATS = {
+    'extraction_rate': '.1f',
+    'average_confidence': '.2f',
+    'processing_time': '.2f',
+}
+
+# openpyxl cell/style classes, imported on first use by _get_styles()
+_styles: Optional[SimpleNamespace] = None
+
+
+def _get_styles() -> SimpleNamespace:
+    """
+    Import the openpyxl cell and style classes once per process.
+    
+    Returns:
+        Namespace with WriteOnlyCell, Font, PatternFill, Alignment,
+        Border, Side and NamedStyle.
+    """
+    global _styles
+    if _styles is None:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import (
+            Font, PatternFill, Alignment, Border, Side, NamedStyle
+        )
+        _styles = SimpleNamespace(
+            WriteOnlyCell=WriteOnlyCell,
+            Font=Font,
+            PatternFill=PatternFill,
+            Alignment=Alignment,
+            Border=Border,
+            Side=Side,
+            NamedStyle=NamedStyle,
+        )
+    return _styles
+
 
 class ExcelExporter:
     """
@@ -38,6 +92,11 @@ class ExcelExporter:
         output_dir: Directory for output files
         include_metadata: Whether to include metadata sheet
         include_confidence: Whether to include confidence scores
+        always_full: Write metadata/confidence sheets for single results too
+        cell_borders: Draw a border around every data cell
+        minimal_styling: Plain bold headers without fills, alignment or borders
+        engine: Workbook writer, "openpyxl" or "xlsxwriter"
+        large_threshold: Row count above which xlsxwriter is used if installed
         
     Example:
         >>> exporter = ExcelExporter()
@@ -45,6 +104,12 @@ class ExcelExporter:
         >>> print(f"Saved to: {filepath}")
     """
     
+    __slots__ = (
+        'output_dir', 'output_dir_str', 'include_metadata', 'include_confidence',
+        'sheet_name', 'always_full', 'cell_borders', 'stream_column_width',
+        'minimal_styling', 'engine', 'large_threshold', '_openpyxl',
+    )
+    
     # Column definitions
     COLUMNS = [
         ('Invoice Number', 'invoice_number'),
@@ -65,12 +130,45 @@ class ExcelExporter:
         ('Average Confidence', 'average_confidence'),
     ]
     
+    # (field, format spec) per metadata column; None means the raw value
+    _META_SPECS = [
+        (field_name, _META_FORMATS.get(field_name))
+        for _, field_name in METADATA_COLUMNS
+    ]
+    
+    # Column letters by position (A..AZ), enough for every sheet above
+    _COL_LETTERS = tuple(ascii_uppercase) + tuple(f"A{c}" for c in ascii_uppercase)
+    
+    # Shared style objects, built once per process by _build_styles()
+    _HEADER_FONT = None
+    _BOLD_FONT = None
+    _HEADER_FILL_BLUE = None
+    _HEADER_FILL_GREEN = None
+    _HEADER_FILL_ORANGE = None
+    _HEADER_ALIGN = None
+    _CENTER_ALIGN = None
+    _THIN_BORDER = None
+    
+    # Named style for bordered data cells, registered once per workbook
+    CELL_STYLE_NAME = "invoice_cell"
+    
     def __init__(self) -> None:
         """Initialize the Excel exporter with configuration."""
         self.output_dir = Path(get_config("paths.output_dir", "outputs"))
+        self.output_dir_str = os.fspath(self.output_dir)
         self.include_metadata = get_config("output.excel.include_metadata", True)
         self.include_confidence = get_config("output.excel.include_confidence", True)
         self.sheet_name = get_config("output.excel.sheet_name", "Extracted Data")
+        self.always_full = get_config("output.excel.always_full", False)
+        self.cell_borders = get_config("output.excel.cell_borders", False)
+        self.stream_column_width = get_config("output.excel.stream_column_width", 20)
+        self.minimal_styling = get_config("output.excel.minimal_styling", False)
+        self.engine = get_config("output.excel.engine", "openpyxl")
+        self.large_threshold = get_config("output.excel.large_threshold", 50000)
+        
+        if self.engine == "xlsxwriter" and not XLSXWRITER_AVAILABLE:
+            logger.warning("xlsxwriter not installed; falling back to openpyxl")
+            self.engine = "openpyxl"
         
         # Check for openpyxl
         self._check_dependencies()
@@ -87,6 +185,31 @@ class ExcelExporter:
                 "openpyxl is required for Excel export. "
                 "Install with: pip install openpyxl"
             )
+        
+        if ExcelExporter._HEADER_FONT is None:
+            self._build_styles()
+    
+    @classmethod
+    def _build_styles(cls) -> None:
+        """Create the style objects shared by all exports."""
+        st = _get_styles()
+        
+        thin = st.Side(style='thin')
+        cls._THIN_BORDER = st.Border(left=thin, right=thin, top=thin, bottom=thin)
+        cls._HEADER_FONT = st.Font(bold=True, color="FFFFFF")
+        cls._BOLD_FONT = st.Font(bold=True)
+        cls._HEADER_FILL_BLUE = st.PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        cls._HEADER_FILL_GREEN = st.PatternFill(start_color="548235", end_color="548235", fill_type="solid")
+        cls._HEADER_FILL_ORANGE = st.PatternFill(start_color="C65911", end_color="C65911", fill_type="solid")
+        cls._HEADER_ALIGN = st.Alignment(horizontal="center", vertical="center")
+        cls._CENTER_ALIGN = st.Alignment(horizontal="center")
+    
+    def _register_cell_style(self, workbook) -> None:
+        """Add the bordered data-cell named style to a workbook."""
+        if self.CELL_STYLE_NAME not in workbook.named_styles:
+            workbook.add_named_style(
+                _get_styles().NamedStyle(name=self.CELL_STYLE_NAME, border=self._THIN_BORDER)
+            )
     
     def export(
         self,
@@ -118,44 +241,325 @@ class ExcelExporter:
         if not results:
             raise ExcelExportError("No results", "No results to export")
         
-        # Determine output path
-        if output_dir:
-            out_dir = Path(output_dir)
-        else:
-            out_dir = self.output_dir
+        filepath = self._output_path(filename, output_dir, "xlsx")
         
-        ensure_directory(out_dir)
-        
-        if filename is None:
-            timestamp = generate_timestamp()
-            filename = f"invoice_extractions_{timestamp}.xlsx"
+        # Extra sheets are skipped for single-record exports unless
+        # always_full is set; they would dominate the write time
+        full = len(results) > 1 or self.always_full
         
-        filepath = out_dir / filename
+        use_xlsxwriter = XLSXWRITER_AVAILABLE and (
+            self.engine == "xlsxwriter" or len(results) > self.large_threshold
+        )
         
         try:
-            # Create workbook
-            workbook = self._openpyxl.Workbook()
+            if use_xlsxwriter:
+                self._export_xlsxwriter(results, filepath, full)
+                logger.info(
+                    f"Excel file saved: {filepath} ({len(results)} records, xlsxwriter)"
+                )
+                return filepath
+            
+            # Create workbook; write-only mode streams rows to the file
+            # writer instead of keeping every Cell object in memory
+            workbook = self._openpyxl.Workbook(write_only=True)
+            if self.cell_borders:
+                self._register_cell_style(workbook)
             
             # Create main data sheet
             self._create_data_sheet(workbook, results)
             
             # Create metadata sheet if enabled
-            if self.include_metadata:
+            if self.include_metadata and full:
                 self._create_metadata_sheet(workbook, results)
             
             # Create confidence sheet if enabled
-            if self.include_confidence:
+            if self.include_confidence and full:
                 self._create_confidence_sheet(workbook, results)
             
-            # Save workbook
-            workbook.save(filepath)
+            self._save_workbook(workbook, filepath)
             
             logger.info(f"Excel file saved: {filepath} ({len(results)} records)")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logger.error(f"Excel export failed: {e}")
-            raise ExcelExportError(str(filepath), str(e))
+            raise ExcelExportError(filepath, str(e))
+    
+    def export_stream(
+        self,
+        results: Iterable[ExtractionResult],
+        filename: Optional[str] = None,
+        output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Export results from any iterable without materializing it.
+        
+        Rows are written to all sheets as results arrive, so only one
+        result is held at a time. Data column widths can't be measured
+        ahead of time and use output.excel.stream_column_width instead.
+        
+        Args:
+            results: Iterable (e.g. generator) of extraction results.
+            filename: Output filename. If None, auto-generated.
+            output_dir: Output directory. If None, uses configured dir.
+            
+        Returns:
+            Path to the created Excel file.
+            
+        Raises:
+            ExcelExportError: If the iterable is empty or export fails.
+            
+        Example:
+            >>> path = exporter.export_stream(r for r in results if r.success)
+        """
+        # Peek at the first result so an empty iterable fails before a
+        # workbook is opened
+        iterator = iter(results)
+        first = next(iterator, None)
+        if first is None:
+            raise ExcelExportError("No results", "No results to export")
+        
+        filepath = self._output_path(filename, output_dir, "xlsx")
+        field_names = [field_name for _, field_name in self.COLUMNS]
+        
+        try:
+            workbook = self._openpyxl.Workbook(write_only=True)
+            if self.cell_borders:
+                self._register_cell_style(workbook)
+            
+            # Open every sheet up front; write-only sheets accept
+            # interleaved appends
+            data_sheet = workbook.create_sheet(title=self.sheet_name)
+            dimensions = data_sheet.column_dimensions
+            for column_letter, (header_name, _) in zip(self._COL_LETTERS, self.COLUMNS):
+                width = max(len(header_name), self.stream_column_width)
+                dimensions[column_letter].width = min(width + 2, 50)
+            data_sheet.freeze_panes = 'A2'
+            self._append_header(
+                data_sheet,
+                [header_name for header_name, _ in self.COLUMNS],
+                self._HEADER_FILL_BLUE,
+                self._HEADER_ALIGN,
+                self._THIN_BORDER
+            )
+            
+            meta_sheet = None
+            if self.include_metadata:
+                meta_sheet = self._start_metadata_sheet(workbook)
+            
+            conf_sheet = None
+            if self.include_confidence:
+                conf_sheet = self._start_confidence_sheet(workbook)
+            
+            count = 0
+            for result in chain((first,), iterator):
+                row = [getattr(result, f, '') or '' for f in field_names]
+                if self.cell_borders:
+                    self._append_bordered(data_sheet, row)
+                else:
+                    data_sheet.append(row)
+                
+                if meta_sheet is not None:
+                    meta_sheet.append(self._metadata_row(result))
+                
+                if conf_sheet is not None:
+                    get_score = result.confidence_scores.get
+                    conf_sheet.append(
+                        [result.source_file or '']
+                        + [f"{get_score(f, 0):.2f}" for f in field_names]
+                    )
+                count += 1
+            
+            self._save_workbook(workbook, filepath)
+            
+            logger.info(f"Excel file saved: {filepath} ({count} records)")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"Excel export failed: {e}")
+            raise ExcelExportError(filepath, str(e))
+    
+    def _export_xlsxwriter(
+        self,
+        results: List[ExtractionResult],
+        filepath: str,
+        full: bool
+    ) -> None:
+        """
+        Write the workbook with xlsxwriter in constant-memory mode.
+        
+        Rows are flushed to disk as they are written, so memory stays
+        flat regardless of the row count. The output is written to a
+        temporary file and renamed into place.
+        
+        Args:
+            results: List of extraction results.
+            filepath: Final output path.
+            full: Whether to write the metadata and confidence sheets.
+        """
+        tmp_path = f"{filepath}.tmp"
+        try:
+            workbook = xlsxwriter.Workbook(tmp_path, {'constant_memory': True})
+            
+            def header_format(color: str, **extra):
+                if self.minimal_styling:
+                    return workbook.add_format({'bold': True})
+                return workbook.add_format({
+                    'bold': True, 'font_color': '#FFFFFF', 'bg_color': color,
+                    'align': 'center', **extra
+                })
+            
+            cell_format = workbook.add_format({'border': 1}) if self.cell_borders else None
+            field_names = [field_name for _, field_name in self.COLUMNS]
+            
+            # Data sheet; widths are measured while writing and applied
+            # at close, which constant_memory mode allows
+            sheet = workbook.add_worksheet(self.sheet_name)
+            sheet.freeze_panes(1, 0)
+            headers = [header_name for header_name, _ in self.COLUMNS]
+            sheet.write_row(0, 0, headers, header_format('#4472C4', valign='vcenter', border=1))
+            max_lengths = [len(header) for header in headers]
+            for row_idx, result in enumerate(results, 1):
+                row = [getattr(result, f, '') or '' for f in field_names]
+                sheet.write_row(row_idx, 0, row, cell_format)
+                for col, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+            for col, max_length in enumerate(max_lengths):
+                sheet.set_column(col, col, min(max_length + 2, 50))
+            
+            if self.include_metadata and full:
+                sheet = workbook.add_worksheet("Metadata")
+                sheet.set_column(0, len(self.METADATA_COLUMNS) - 1, 20)
+                sheet.write_row(
+                    0, 0,
+                    [header_name for header_name, _ in self.METADATA_COLUMNS],
+                    header_format('#548235')
+                )
+                for row_idx, result in enumerate(results, 1):
+                    sheet.write_row(row_idx, 0, self._metadata_row(result))
+            
+            if self.include_confidence and full:
+                sheet = workbook.add_worksheet("Confidence Scores")
+                columns = ['Source File'] + [f"{name} Conf." for name in headers]
+                sheet.set_column(0, len(columns) - 1, 18)
+                sheet.write_row(0, 0, columns, header_format('#C65911'))
+                for row_idx, result in enumerate(results, 1):
+                    get_score = result.confidence_scores.get
+                    sheet.write_row(
+                        row_idx, 0,
+                        [result.source_file or '']
+                        + [f"{get_score(f, 0):.2f}" for f in field_names]
+                    )
+            
+            workbook.close()
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    @staticmethod
+    def _save_workbook(workbook, filepath: str) -> None:
+        """
+        Save a workbook atomically.
+        
+        The workbook is serialized to memory, written with one buffered
+        write to a temporary file and renamed into place, so a crash
+        never leaves a partial file at the final path.
+        
+        Args:
+            workbook: openpyxl Workbook instance.
+            filepath: Final output path.
+        """
+        tmp_path = f"{filepath}.tmp"
+        try:
+            buffer = io.BytesIO()
+            workbook.save(buffer)
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    def export_csv(
+        self,
+        results: Union[ExtractionResult, List[ExtractionResult]],
+        filename: Optional[str] = None,
+        output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Export the main data columns to a CSV file.
+        
+        Much faster than XLSX for large batches since there is no XML
+        or zip layer; only the data sheet columns are written.
+        
+        Args:
+            results: Single result or list of results to export.
+            filename: Output filename. If None, auto-generated.
+            output_dir: Output directory. If None, uses configured dir.
+            
+        Returns:
+            Path to the created CSV file.
+            
+        Raises:
+            ExcelExportError: If export fails.
+        """
+        if isinstance(results, ExtractionResult):
+            results = [results]
+        
+        if not results:
+            raise ExcelExportError("No results", "No results to export")
+        
+        filepath = self._output_path(filename, output_dir, "csv")
+        field_names = [field_name for _, field_name in self.COLUMNS]
+        
+        try:
+            with open(filepath, 'w', newline='', encoding='utf-8',
+                      buffering=_WRITE_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow([header_name for header_name, _ in self.COLUMNS])
+                writer.writerows(
+                    [getattr(result, f, '') or '' for f in field_names]
+                    for result in results
+                )
+            
+            logger.info(f"CSV file saved: {filepath} ({len(results)} records)")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"CSV export failed: {e}")
+            raise ExcelExportError(filepath, str(e))
+    
+    def _output_path(
+        self,
+        filename: Optional[str],
+        output_dir: Optional[str],
+        extension: str
+    ) -> str:
+        """
+        Resolve the output file path, creating the directory if needed.
+        
+        Joins plain strings rather than building Path objects.
+        
+        Args:
+            filename: Output filename. If None, auto-generated.
+            output_dir: Output directory. If None, uses configured dir.
+            extension: File extension used for generated names.
+            
+        Returns:
+            Full output path.
+        """
+        out_dir = os.fspath(output_dir) if output_dir else self.output_dir_str
+        ensure_directory(out_dir)
+        
+        if filename is None:
+            filename = f"invoice_extractions_{generate_timestamp()}.{extension}"
+        
+        return os.path.join(out_dir, filename)
     
     def _create_data_sheet(
         self,
@@ -169,55 +573,103 @@ class ExcelExporter:
             workbook: openpyxl Workbook instance.
             results: List of extraction results.
         """
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
-        
-        # Get active sheet and rename
-        sheet = workbook.active
-        sheet.title = self.sheet_name
-        
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        sheet = workbook.create_sheet(title=self.sheet_name)
         
-        # Write headers
-        for col, (header_name, _) in enumerate(self.COLUMNS, 1):
-            cell = sheet.cell(row=1, column=col, value=header_name)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # Write data rows
-        for row_num, result in enumerate(results, 2):
-            for col, (_, field_name) in enumerate(self.COLUMNS, 1):
-                value = getattr(result, field_name, '') or ''
-                cell = sheet.cell(row=row_num, column=col, value=value)
-                cell.border = thin_border
+        # Build one row per result, then measure the widest value per column
+        field_names = [field_name for _, field_name in self.COLUMNS]
+        rows = [
+            [getattr(result, f, '') or '' for f in field_names]
+            for result in results
+        ]
+        max_lengths = [
+            max(len(header_name), max(len(str(value)) for value in column))
+            for (header_name, _), column in zip(self.COLUMNS, zip(*rows))
+        ]
         
-        # Adjust column widths
-        for col, (header_name, _) in enumerate(self.COLUMNS, 1):
-            column_letter = get_column_letter(col)
-            
-            # Calculate max width
-            max_length = len(header_name)
-            for row in range(2, len(results) + 2):
-                cell_value = sheet.cell(row=row, column=col).value
-                if cell_value:
-                    max_length = max(max_length, len(str(cell_value)))
-            
+        # Adjust column widths (write-only sheets need them before rows)
+        dimensions = sheet.column_dimensions
+        for column_letter, max_length in zip(self._COL_LETTERS, max_lengths):
             # Set width with padding
-            sheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
+            dimensions[column_letter].width = min(max_length + 2, 50)
         
         # Freeze header row
         sheet.freeze_panes = 'A2'
+        
+        # Write headers
+        self._append_header(
+            sheet,
+            [header_name for header_name, _ in self.COLUMNS],
+            self._HEADER_FILL_BLUE,
+            self._HEADER_ALIGN,
+            self._THIN_BORDER
+        )
+        
+        # Write data rows; plain values unless per-cell borders are wanted
+        if not self.cell_borders:
+            for row in rows:
+                sheet.append(row)
+            return
+        
+        for row in rows:
+            self._append_bordered(sheet, row)
+    
+    def _append_header(
+        self,
+        sheet,
+        headers: List[str],
+        fill,
+        alignment,
+        border=None
+    ) -> None:
+        """
+        Append a styled header row to a write-only sheet.
+        
+        Args:
+            sheet: Write-only worksheet.
+            headers: Header labels.
+            fill: Header PatternFill.
+            alignment: Header Alignment.
+            border: Optional header Border.
+        """
+        WriteOnlyCell = _get_styles().WriteOnlyCell
+        
+        header_row = []
+        
+        # Minimal styling: bold text only, no fill, alignment or border
+        if self.minimal_styling:
+            for header in headers:
+                cell = WriteOnlyCell(sheet, value=header)
+                cell.font = self._BOLD_FONT
+                header_row.append(cell)
+            sheet.append(header_row)
+            return
+        
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.font = self._HEADER_FONT
+            cell.fill = fill
+            cell.alignment = alignment
+            if border is not None:
+                cell.border = border
+            header_row.append(cell)
+        sheet.append(header_row)
+    
+    def _append_bordered(self, sheet, row: List[Any]) -> None:
+        """
+        Append a data row using the bordered named cell style.
+        
+        Args:
+            sheet: Write-only worksheet.
+            row: Cell values.
+        """
+        WriteOnlyCell = _get_styles().WriteOnlyCell
+        
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(sheet, value=value)
+            cell.style = self.CELL_STYLE_NAME
+            cells.append(cell)
+        sheet.append(cells)
     
     def _create_metadata_sheet(
         self,
@@ -231,40 +683,53 @@ class ExcelExporter:
             workbook: openpyxl Workbook instance.
             results: List of extraction results.
         """
-        from openpyxl.styles import Font, PatternFill, Alignment
-        from openpyxl.utils import get_column_letter
+        sheet = self._start_metadata_sheet(workbook)
+        
+        # Write data
+        for result in results:
+            sheet.append(self._metadata_row(result))
+    
+    def _start_metadata_sheet(self, workbook):
+        """
+        Create the metadata sheet with column widths and header row.
         
+        Args:
+            workbook: openpyxl Workbook instance.
+            
+        Returns:
+            The new write-only worksheet.
+        """
         sheet = workbook.create_sheet(title="Metadata")
         
-        # Header style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="548235", end_color="548235", fill_type="solid")
+        # Adjust column widths
+        dimensions = sheet.column_dimensions
+        for column_letter in self._COL_LETTERS[:len(self.METADATA_COLUMNS)]:
+            dimensions[column_letter].width = 20
         
         # Write headers
-        for col, (header_name, _) in enumerate(self.METADATA_COLUMNS, 1):
-            cell = sheet.cell(row=1, column=col, value=header_name)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-        
-        # Write data
-        for row_num, result in enumerate(results, 2):
-            for col, (_, field_name) in enumerate(self.METADATA_COLUMNS, 1):
-                if field_name == 'extraction_rate':
-                    value = f"{result.extraction_rate:.1f}"
-                elif field_name == 'average_confidence':
-                    value = f"{result.average_confidence:.2f}"
-                elif field_name == 'processing_time':
-                    value = f"{result.processing_time:.2f}"
-                else:
-                    value = getattr(result, field_name, '') or ''
-                
-                sheet.cell(row=row_num, column=col, value=value)
+        self._append_header(
+            sheet,
+            [header_name for header_name, _ in self.METADATA_COLUMNS],
+            self._HEADER_FILL_GREEN,
+            self._CENTER_ALIGN
+        )
+        return sheet
+    
+    def _metadata_row(self, result: ExtractionResult) -> List[Any]:
+        """
+        Build the metadata sheet row for one result.
         
-        # Adjust column widths
-        for col in range(1, len(self.METADATA_COLUMNS) + 1):
-            column_letter = get_column_letter(col)
-            sheet.column_dimensions[column_letter].width = 20
+        Args:
+            result: Extraction result.
+            
+        Returns:
+            Cell values in METADATA_COLUMNS order.
+        """
+        return [
+            format(getattr(result, field_name), spec) if spec
+            else getattr(result, field_name, '') or ''
+            for field_name, spec in self._META_SPECS
+        ]
     
     def _create_confidence_sheet(
         self,
@@ -278,37 +743,45 @@ class ExcelExporter:
             workbook: openpyxl Workbook instance.
             results: List of extraction results.
         """
-        from openpyxl.styles import Font, PatternFill, Alignment
-        from openpyxl.utils import get_column_letter
+        sheet = self._start_confidence_sheet(workbook)
         
-        sheet = workbook.create_sheet(title="Confidence Scores")
+        # Write data
+        field_names = [field_name for _, field_name in self.COLUMNS]
+        for result in results:
+            get_score = result.confidence_scores.get
+            sheet.append(
+                [result.source_file or '']
+                + [f"{get_score(f, 0):.2f}" for f in field_names]
+            )
+    
+    def _start_confidence_sheet(self, workbook):
+        """
+        Create the confidence sheet with column widths and header row.
         
-        # Header style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="C65911", end_color="C65911", fill_type="solid")
+        Args:
+            workbook: openpyxl Workbook instance.
+            
+        Returns:
+            The new write-only worksheet.
+        """
+        sheet = workbook.create_sheet(title="Confidence Scores")
         
         # Columns: Source File + all field confidence scores
         columns = ['Source File'] + [f"{name} Conf." for name, _ in self.COLUMNS]
         
-        # Write headers
-        for col, header in enumerate(columns, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-        
-        # Write data
-        for row_num, result in enumerate(results, 2):
-            sheet.cell(row=row_num, column=1, value=result.source_file or '')
-            
-            for col, (_, field_name) in enumerate(self.COLUMNS, 2):
-                confidence = result.confidence_scores.get(field_name, 0)
-                sheet.cell(row=row_num, column=col, value=f"{confidence:.2f}")
-        
         # Adjust column widths
-        for col in range(1, len(columns) + 1):
-            column_letter = get_column_letter(col)
-            sheet.column_dimensions[column_letter].width = 18
+        dimensions = sheet.column_dimensions
+        for column_letter in self._COL_LETTERS[:len(columns)]:
+            dimensions[column_letter].width = 18
+        
+        # Write headers
+        self._append_header(
+            sheet,
+            columns,
+            self._HEADER_FILL_ORANGE,
+            self._CENTER_ALIGN
+        )
+        return sheet
     
     def get_default_filename(self) -> str:
         """
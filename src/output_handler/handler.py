@@ -7,6 +7,7 @@ all output operations (Excel and Database).
 Author: ML Engineering Team
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 
@@ -30,6 +31,7 @@ class OutputHandler:
     Attributes:
         excel_enabled: Whether Excel export is enabled
         database_enabled: Whether database storage is enabled
+        csv_enabled: Whether CSV export is enabled
         excel_exporter: ExcelExporter instance
         database_handler: DatabaseHandler instance
         
@@ -42,6 +44,12 @@ class OutputHandler:
         >>> handler.to_database(results)
     """
     
+    __slots__ = (
+        'excel_enabled', 'database_enabled', 'csv_enabled',
+        'excel_exporter', 'database_handler',
+        '_pending', '_flush_threshold',
+    )
+    
     def __init__(
         self,
         excel_enabled: Optional[bool] = None,
@@ -59,29 +67,44 @@ class OutputHandler:
             get_config("output.excel.enabled", True)
         self.database_enabled = database_enabled if database_enabled is not None else \
             get_config("output.database.enabled", True)
+        self.csv_enabled = get_config("output.csv.enabled", False)
+        
+        # excel_exporter / database_handler slots are filled on first
+        # access by __getattr__
         
-        # Initialize exporters (lazy loading)
-        self._excel_exporter = None
-        self._database_handler = None
+        # Database rows buffered by save() until the threshold is reached
+        self._pending: List[ExtractionResult] = []
+        self._flush_threshold = get_config("output.batch_size", 64)
         
         logger.info(
             f"OutputHandler initialized "
             f"(excel={self.excel_enabled}, database={self.database_enabled})"
         )
     
-    @property
-    def excel_exporter(self) -> ExcelExporter:
-        """Get or create the Excel exporter."""
-        if self._excel_exporter is None:
-            self._excel_exporter = ExcelExporter()
-        return self._excel_exporter
-    
-    @property
-    def database_handler(self) -> DatabaseHandler:
-        """Get or create the database handler."""
-        if self._database_handler is None:
-            self._database_handler = DatabaseHandler()
-        return self._database_handler
+    def __getattr__(self, name: str) -> Any:
+        """
+        Create the exporters on first access.
+        
+        Only called while the slot is still empty; the instance is
+        stored in the slot, so later lookups never reach this method.
+        
+        Args:
+            name: Attribute name.
+            
+        Returns:
+            ExcelExporter or DatabaseHandler instance.
+        """
+        if name == 'excel_exporter':
+            value = ExcelExporter()
+        elif name == 'database_handler':
+            value = DatabaseHandler()
+        else:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        
+        object.__setattr__(self, name, value)
+        return value
     
     def save(
         self,
@@ -91,6 +114,10 @@ class OutputHandler:
         """
         Save results to all enabled outputs.
         
+        Database rows are buffered and written in one batch once
+        output.batch_size records are pending; call flush() or close()
+        to write the remainder.
+        
         Args:
             results: Single result or list of results.
             excel_filename: Custom Excel filename (optional).
@@ -99,8 +126,10 @@ class OutputHandler:
             Dictionary with output details:
             {
                 'excel_path': 'path/to/file.xlsx',
+                'csv_path': 'path/to/file.csv',
                 'database_records': {'inserted': 5, 'skipped': 0}
             }
+            database_records is None when the rows are still buffered.
             
         Example:
             >>> output_info = handler.save(results)
@@ -112,24 +141,48 @@ class OutputHandler:
         
         output_info = {
             'excel_path': None,
+            'csv_path': None,
             'database_records': None
         }
         
-        # Export to Excel
-        if self.excel_enabled:
-            try:
-                excel_path = self.to_excel(results, excel_filename)
-                output_info['excel_path'] = excel_path
-            except Exception as e:
-                logger.error(f"Excel export failed: {e}")
-        
-        # Save to database
-        if self.database_enabled:
-            try:
-                db_result = self.to_database(results)
-                output_info['database_records'] = db_result
-            except Exception as e:
-                logger.error(f"Database save failed: {e}")
+        # The file exports and the database write are independent and
+        # I/O-bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            excel_future = None
+            if self.excel_enabled:
+                excel_future = executor.submit(self.to_excel, results, excel_filename)
+            
+            csv_future = None
+            if self.csv_enabled:
+                csv_filename = None
+                if excel_filename:
+                    csv_filename = str(Path(excel_filename).with_suffix('.csv'))
+                csv_future = executor.submit(self.to_csv, results, csv_filename)
+            
+            # Queue for the database; write once enough rows are pending
+            db_future = None
+            if self.database_enabled:
+                self._pending.extend(results)
+                if len(self._pending) >= self._flush_threshold:
+                    db_future = executor.submit(self._flush_db)
+            
+            if excel_future is not None:
+                try:
+                    output_info['excel_path'] = excel_future.result()
+                except Exception as e:
+                    logger.error(f"Excel export failed: {e}")
+            
+            if csv_future is not None:
+                try:
+                    output_info['csv_path'] = csv_future.result()
+                except Exception as e:
+                    logger.error(f"CSV export failed: {e}")
+            
+            if db_future is not None:
+                try:
+                    output_info['database_records'] = db_future.result()
+                except Exception as e:
+                    logger.error(f"Database save failed: {e}")
         
         return output_info
     
@@ -155,6 +208,28 @@ class OutputHandler:
         
         return self.excel_exporter.export(results, filename, output_dir)
     
+    def to_csv(
+        self,
+        results: Union[ExtractionResult, List[ExtractionResult]],
+        filename: Optional[str] = None,
+        output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Export results to a CSV file.
+        
+        Args:
+            results: Results to export.
+            filename: Output filename.
+            output_dir: Output directory.
+            
+        Returns:
+            Path to created CSV file.
+        """
+        if isinstance(results, ExtractionResult):
+            results = [results]
+        
+        return self.excel_exporter.export_csv(results, filename, output_dir)
+    
     def to_database(
         self,
         results: Union[ExtractionResult, List[ExtractionResult]]
@@ -173,6 +248,23 @@ class OutputHandler:
         
         return self.database_handler.insert_batch(results)
     
+    def flush(self) -> Dict[str, int]:
+        """
+        Write any database rows buffered by save().
+        
+        Returns:
+            Dictionary with 'inserted' and 'skipped' counts for the
+            flushed rows (both 0 when nothing was pending).
+        """
+        if not self._pending:
+            return {'inserted': 0, 'skipped': 0}
+        return self._flush_db()
+    
+    def _flush_db(self) -> Dict[str, int]:
+        """Insert all pending rows with a single batch insert."""
+        pending, self._pending = self._pending, []
+        return self.database_handler.insert_batch(pending)
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get statistics from the database.
@@ -224,6 +316,16 @@ class OutputHandler:
         return self.database_handler.get_all(limit)
     
     def close(self) -> None:
-        """Close all output handlers."""
-        if self._database_handler:
-            self._database_handler.close()
+        """Flush buffered rows and close all output handlers."""
+        if self._pending:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Database save failed: {e}")
+        
+        # Read the slot directly so an unused handler isn't created here
+        try:
+            database_handler = object.__getattribute__(self, 'database_handler')
+        except AttributeError:
+            return
+        database_handler.close()
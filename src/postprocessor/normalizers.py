@@ -11,8 +11,10 @@ Author: ML Engineering Team
 
 import re
 from datetime import datetime
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 from dateutil import parser as date_parser
+import numpy as np
 
 from config import get_config
 from src.utils.logger import get_logger
@@ -20,6 +22,265 @@ from src.utils.logger import get_logger
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Numba is optional; when available, long ASCII amount strings are
+# filtered with a compiled loop instead of a regex substitution
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum string length before the Numba kernel beats the regex
+NUMBA_MIN_LEN = 32
+
+# Hyperscan is optional; when available, extract_date() finds which date
+# patterns occur with one pass over the text before running any regex
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Ordinal day suffixes (1st, 2nd, 3rd, 4th, ...)
+_ORDINAL_RE = re.compile(r'(\d+)(st|nd|rd|th)', re.IGNORECASE)
+
+# Everything except digits, comma, dot and minus
+_NON_NUMERIC_RE = re.compile(r'[^\d,.\-]+')
+
+# Already-clean ASCII amounts with an optional leading currency symbol,
+# e.g. "1234.56", "-80" or "$1,234.56"; group 1 is the number
+_PLAIN_AMOUNT_RE = re.compile(
+    r'[$€£¥₹]?(-?(?:[0-9]{1,3}(?:,[0-9]{3})+|[0-9]+)(?:\.[0-9]+)?)'
+)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _keep_numeric(buf):
+        """Copy only the ASCII digits, ',', '.' and '-' from a byte array."""
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        count = 0
+        for c in buf:
+            if (48 <= c <= 57) or c == 44 or c == 46 or c == 45:
+                out[count] = c
+                count += 1
+        return out[:count]
+
+
+def _strip_non_numeric(text: str) -> str:
+    """
+    Remove everything except digits, comma, dot and minus.
+    
+    Long ASCII strings go through the Numba kernel when available;
+    short or non-ASCII strings use the regex (which also keeps
+    non-ASCII digits).
+    
+    Args:
+        text: Input string.
+        
+    Returns:
+        Filtered string.
+    """
+    if NUMBA_AVAILABLE and len(text) >= NUMBA_MIN_LEN and text.isascii():
+        buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        return _keep_numeric(buf).tobytes().decode('ascii')
+    return _NON_NUMERIC_RE.sub('', text)
+
+# Cheap gate before dateutil: anything it can parse has a digit or a
+# month/weekday name
+_MAYBE_DATE_RE = re.compile(
+    r'\d|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|mon|tue|wed|thu|fri|sat|sun',
+    re.IGNORECASE
+)
+
+# Distinct raw strings remembered by the normalize() caches
+_NORMALIZE_CACHE_SIZE = 4096
+
+# Default output format; produced with date.isoformat() instead of strftime
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+# Shape of a date string: letter runs become 'a', digit runs become '9'
+# and everything else is kept ("January 15, 2026" -> "a9,9"). A space
+# before a digit run is folded into it, because strptime's %d and %I
+# accept a space-padded value ("2026-11- 6")
+_LETTERS_RE = re.compile(r'[^\W\d_]+')
+_DIGITS_RE = re.compile(r'(?: ?\d+)+')
+_FORMAT_DIGITS_RE = re.compile(r'(?: ?9)+')
+
+# strptime directives by the shape of the text they consume; formats
+# using any other directive are always tried
+_DIGIT_DIRECTIVES = frozenset('dmyYHIMSjfUW')
+_LETTER_DIRECTIVES = frozenset('aAbBp')
+
+
+def _date_shape(date_str: str) -> str:
+    """
+    Reduce a date string to its shape.
+    
+    Args:
+        date_str: Cleaned date string.
+        
+    Returns:
+        Shape string, e.g. "9/9/9" for "01/15/2026".
+    """
+    return _DIGITS_RE.sub('9', _LETTERS_RE.sub('a', date_str))
+
+
+@lru_cache(maxsize=None)
+def _format_shape(fmt: str) -> Optional[str]:
+    """
+    Shape of the strings a strptime format can match.
+    
+    Args:
+        fmt: strptime format string.
+        
+    Returns:
+        Shape string comparable with _date_shape(), or None if the
+        format uses a directive whose shape isn't known.
+    """
+    parts = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char == '%' and i + 1 < len(fmt):
+            directive = fmt[i + 1]
+            i += 2
+            if directive in _DIGIT_DIRECTIVES:
+                char = '9'
+            elif directive in _LETTER_DIRECTIVES:
+                char = 'a'
+            elif directive == '%':
+                char = '%'
+            else:
+                return None
+        else:
+            i += 1
+            if char.isdigit():
+                char = '9'
+            elif char.isalpha():
+                char = 'a'
+            elif char.isspace():
+                char = ' '
+        # Adjacent runs of the same class merge, as they do in the input
+        if not (parts and char in '9a ' and parts[-1] == char):
+            parts.append(char)
+    return _FORMAT_DIGITS_RE.sub('9', ''.join(parts))
+
+
+@lru_cache(maxsize=256)
+def _pick_formats(shape: str, input_formats: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Select the formats that could match strings of the given shape.
+    
+    The configured order is kept, so the first format that parses
+    still wins exactly as if every format had been tried.
+    
+    Args:
+        shape: Shape of the input from _date_shape().
+        input_formats: Explicit formats in priority order.
+        
+    Returns:
+        Candidate formats, possibly empty.
+    """
+    candidates = []
+    for fmt in input_formats:
+        fmt_shape = _format_shape(fmt)
+        if fmt_shape is None or fmt_shape == shape:
+            candidates.append(fmt)
+    return tuple(candidates)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_date(
+    date_str: str,
+    output_format: str,
+    input_formats: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Parse and format one date string; memoized on all arguments.
+    
+    Invoice batches repeat the same date strings often, and a miss
+    costs up to len(input_formats) strptime calls plus dateutil.
+    
+    Args:
+        date_str: Raw date string.
+        output_format: Target strftime format.
+        input_formats: Explicit formats to try first.
+        
+    Returns:
+        Normalized date string, or None if parsing fails.
+    """
+    # Clean the input
+    date_str = DateNormalizer._clean_date_string(date_str)
+    
+    # Try explicit formats first
+    parsed_date = DateNormalizer._try_explicit_formats(date_str, input_formats)
+    
+    # If explicit formats fail, try dateutil parser
+    if parsed_date is None:
+        parsed_date = DateNormalizer._try_dateutil_parser(date_str)
+    
+    # Format output
+    if parsed_date:
+        # isoformat() matches strftime for 4-digit years at a fraction of
+        # the cost; strftime doesn't zero-pad earlier years
+        if output_format == _ISO_DATE_FORMAT and parsed_date.year >= 1000:
+            return parsed_date.date().isoformat()
+        try:
+            return parsed_date.strftime(output_format)
+        except Exception as e:
+            logger.debug("Date formatting failed: %s", e)
+            return None
+    
+    logger.debug("Could not parse date: %s", date_str)
+    return None
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_amount(amount_str: str, output_format: str) -> Optional[str]:
+    """
+    Parse and format one amount string; memoized on both arguments.
+    
+    Args:
+        amount_str: Raw amount string.
+        output_format: 'float' for two-decimal output, else the cleaned string.
+        
+    Returns:
+        Normalized amount string or None.
+    """
+    # Fast path: the amount is already a plain number, so cleaning and
+    # separator detection can only drop the symbol and thousands commas
+    match = _PLAIN_AMOUNT_RE.fullmatch(amount_str)
+    if match:
+        amount_str = match.group(1).replace(',', '')
+        return f"{float(amount_str):.2f}" if output_format == 'float' else amount_str
+    
+    # Clean the input
+    amount_str = AmountNormalizer._clean_amount_string(amount_str)
+    
+    if not amount_str:
+        return None
+    
+    # Handle European format (comma as decimal)
+    amount_str = AmountNormalizer._handle_european_format(amount_str)
+    
+    # Remove thousand separators
+    amount_str = amount_str.replace(',', '')
+    
+    # Validate it's a number
+    try:
+        value = float(amount_str)
+        
+        # Format output
+        if output_format == 'float':
+            return f"{value:.2f}"
+        else:
+            return amount_str
+            
+    except ValueError:
+        logger.debug("Could not parse amount: %s", amount_str)
+        return None
+
 
 class DateNormalizer:
     """
@@ -30,7 +291,7 @@ class DateNormalizer:
     
     Attributes:
         output_format: Target date format string
-        input_formats: List of recognized input format strings
+        input_formats: Tuple of recognized input format strings
         
     Example:
         >>> normalizer = DateNormalizer()
@@ -51,14 +312,40 @@ class DateNormalizer:
         # DD Month YYYY
         r'\b(\d{1,2})(?:st|nd|rd|th)?\s+((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*)\s+(\d{2,4})\b',
     ]
+    _DATE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in DATE_PATTERNS]
+    
+    # All DATE_PATTERNS as one alternation; group p<i> wraps pattern i.
+    # Every pattern starts at a word boundary with a digit or a month
+    # initial, so that guard runs first and most positions are rejected
+    # without trying the four alternatives.
+    _COMBINED_DATE_RE = re.compile(
+        r'\b(?=[\djfmasond])(?:'
+        + '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(DATE_PATTERNS))
+        + ')',
+        re.IGNORECASE
+    )
+    
+    # Leading labels stripped by _clean_date_string(), in the order they
+    # are removed (e.g. "Invoice Date: on 5 Jan 2026")
+    _DATE_PREFIX_RE = re.compile(
+        r'^(?:date:\s*)?(?:dated:\s*)?(?:invoice date:\s*)?(?:due date:\s*)?(?:on\s*)?',
+        re.IGNORECASE
+    )
+    
+    # Hyperscan database over DATE_PATTERNS, compiled on first use
+    _hs_database = None
+    
+    __slots__ = ('output_format', 'input_formats')
     
     def __init__(self) -> None:
         """Initialize the date normalizer with configuration."""
         self.output_format = get_config(
             "postprocessing.date.output_format", 
-            "%Y-%m-%d"
+            _ISO_DATE_FORMAT
         )
-        self.input_formats = get_config(
+        # Bound as a tuple: it is also the hashable cache key for
+        # _normalize_date()
+        self.input_formats = tuple(get_config(
             "postprocessing.date.input_formats",
             [
                 "%m/%d/%Y",
@@ -71,7 +358,7 @@ class DateNormalizer:
                 "%m-%d-%Y",
                 "%d.%m.%Y"
             ]
-        )
+        ))
         
         logger.debug(f"DateNormalizer initialized (output: {self.output_format})")
     
@@ -92,28 +379,10 @@ class DateNormalizer:
         if not date_str:
             return None
         
-        # Clean the input
-        date_str = self._clean_date_string(date_str)
-        
-        # Try explicit formats first
-        parsed_date = self._try_explicit_formats(date_str)
-        
-        # If explicit formats fail, try dateutil parser
-        if parsed_date is None:
-            parsed_date = self._try_dateutil_parser(date_str)
-        
-        # Format output
-        if parsed_date:
-            try:
-                return parsed_date.strftime(self.output_format)
-            except Exception as e:
-                logger.debug(f"Date formatting failed: {e}")
-                return None
-        
-        logger.debug(f"Could not parse date: {date_str}")
-        return None
+        return _normalize_date(date_str, self.output_format, self.input_formats)
     
-    def _clean_date_string(self, date_str: str) -> str:
+    @classmethod
+    def _clean_date_string(cls, date_str: str) -> str:
         """
         Clean and prepare date string for parsing.
         
@@ -127,34 +396,58 @@ class DateNormalizer:
         date_str = ' '.join(date_str.split())
         
         # Remove common prefixes
-        prefixes = ['date:', 'dated:', 'invoice date:', 'due date:', 'on']
-        for prefix in prefixes:
-            if date_str.lower().startswith(prefix):
-                date_str = date_str[len(prefix):].strip()
+        date_str = cls._DATE_PREFIX_RE.sub('', date_str, count=1)
         
         # Remove ordinal suffixes (1st, 2nd, 3rd, 4th, etc.)
-        date_str = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_str, flags=re.IGNORECASE)
+        date_str = _ORDINAL_RE.sub(r'\1', date_str)
         
         return date_str.strip()
     
-    def _try_explicit_formats(self, date_str: str) -> Optional[datetime]:
+    @staticmethod
+    def _try_explicit_formats(
+        date_str: str,
+        input_formats: Tuple[str, ...]
+    ) -> Optional[datetime]:
         """
         Try to parse date using explicit format strings.
         
+        Only formats whose shape matches the input are attempted, so a
+        typical date costs one strptime call instead of one failed
+        call per non-matching format.
+        
         Args:
             date_str: Date string to parse.
+            input_formats: Format strings to try in order.
             
         Returns:
             Parsed datetime or None.
         """
-        for fmt in self.input_formats:
+        candidates = _pick_formats(_date_shape(date_str), input_formats)
+        
+        # YYYY-MM-DD goes through the C ISO parser when "%Y-%m-%d" is the
+        # format strptime would try first; anything it rejects still
+        # falls through to the strptime loop
+        if (
+            candidates
+            and candidates[0] == _ISO_DATE_FORMAT
+            and len(date_str) == 10
+            and date_str[4] == '-'
+            and date_str[7] == '-'
+        ):
+            try:
+                return datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+        
+        for fmt in candidates:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
         return None
     
-    def _try_dateutil_parser(self, date_str: str) -> Optional[datetime]:
+    @staticmethod
+    def _try_dateutil_parser(date_str: str) -> Optional[datetime]:
         """
         Try to parse date using dateutil's fuzzy parser.
         
@@ -164,6 +457,10 @@ class DateNormalizer:
         Returns:
             Parsed datetime or None.
         """
+        # The fuzzy parser is slow; skip strings that can't hold a date
+        if not _MAYBE_DATE_RE.search(date_str):
+            return None
+        
         try:
             # Use dateutil parser with dayfirst=False (US format default)
             return date_parser.parse(date_str, dayfirst=False, fuzzy=True)
@@ -174,6 +471,64 @@ class DateNormalizer:
             except Exception:
                 return None
     
+    @classmethod
+    def _date_matches(cls, text: str) -> Iterator[re.Match]:
+        """
+        Yield the first match of each date pattern, in priority order.
+        
+        Without Hyperscan, one scan with the combined pattern finds the
+        leftmost date. Text with no date is rejected after that single
+        pass. Otherwise the combined match is reused for its own pattern,
+        and higher-priority patterns only search past it, since they
+        cannot match any earlier.
+        
+        With Hyperscan, all DATE_PATTERNS are scanned in a single pass and
+        only the patterns that occur are searched. Non-ASCII text skips
+        Hyperscan since its word-boundary and digit classes are ASCII-only.
+        
+        Args:
+            text: Text to search.
+            
+        Yields:
+            One match per date pattern that occurs in text.
+        """
+        if HYPERSCAN_AVAILABLE and text.isascii():
+            if cls._hs_database is None:
+                flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[pattern.encode('ascii') for pattern in cls.DATE_PATTERNS],
+                    ids=list(range(len(cls.DATE_PATTERNS))),
+                    elements=len(cls.DATE_PATTERNS),
+                    flags=[flags] * len(cls.DATE_PATTERNS)
+                )
+                cls._hs_database = database
+            
+            hits = set()
+            cls._hs_database.scan(
+                text.encode('ascii'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id)
+            )
+            for index in sorted(hits):
+                match = cls._DATE_RES[index].search(text)
+                if match:
+                    yield match
+            return
+        
+        first = cls._COMBINED_DATE_RE.search(text)
+        if first is None:
+            return
+        
+        first_index = int(first.lastgroup[1:])
+        for index, pattern in enumerate(cls._DATE_RES):
+            if index == first_index:
+                yield first
+                continue
+            
+            match = pattern.search(text, first.start() + 1 if index < first_index else 0)
+            if match:
+                yield match
+    
     def extract_date(self, text: str) -> Optional[str]:
         """
         Extract and normalize a date from text.
@@ -186,13 +541,10 @@ class DateNormalizer:
         Returns:
             Normalized date string or None.
         """
-        for pattern in self.DATE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(0)
-                normalized = self.normalize(date_str)
-                if normalized:
-                    return normalized
+        for match in self._date_matches(text):
+            normalized = self.normalize(match.group(0))
+            if normalized:
+                return normalized
         
         # Try normalizing the entire text
         return self.normalize(text)
@@ -234,6 +586,18 @@ class AmountNormalizer:
     CURRENCY_SYMBOLS = ['$', '€', '£', '¥', '₹', '₽', '₿', '฿', '₫', '₴', '₦']
     CURRENCY_CODES = ['USD', 'EUR', 'GBP', 'JPY', 'INR', 'CAD', 'AUD', 'CNY', 'RUB']
     
+    # Compiled once: all currency codes as whole words, and the amount
+    # patterns used by extract_amount()
+    _CODE_RE = re.compile(rf"\b(?:{'|'.join(CURRENCY_CODES)})\b", re.IGNORECASE)
+    _AMOUNT_RES = [
+        re.compile(r'[\$€£¥₹]?\s*[\d,]+\.?\d*', re.IGNORECASE),
+        re.compile(r'[\d,]+\.?\d*\s*(?:USD|EUR|GBP|INR)?', re.IGNORECASE),
+    ]
+    
+    __slots__ = (
+        'currencies', 'decimal_separator', 'thousands_separator', 'output_format',
+    )
+    
     def __init__(self) -> None:
         """Initialize the amount normalizer with configuration."""
         self.currencies = get_config(
@@ -272,33 +636,10 @@ class AmountNormalizer:
         if not amount_str:
             return None
         
-        # Clean the input
-        amount_str = self._clean_amount_string(amount_str)
-        
-        if not amount_str:
-            return None
-        
-        # Handle European format (comma as decimal)
-        amount_str = self._handle_european_format(amount_str)
-        
-        # Remove thousand separators
-        amount_str = amount_str.replace(',', '')
-        
-        # Validate it's a number
-        try:
-            value = float(amount_str)
-            
-            # Format output
-            if self.output_format == 'float':
-                return f"{value:.2f}"
-            else:
-                return amount_str
-                
-        except ValueError:
-            logger.debug(f"Could not parse amount: {amount_str}")
-            return None
+        return _normalize_amount(amount_str, self.output_format)
     
-    def _clean_amount_string(self, amount_str: str) -> str:
+    @classmethod
+    def _clean_amount_string(cls, amount_str: str) -> str:
         """
         Clean and prepare amount string for parsing.
         
@@ -308,29 +649,17 @@ class AmountNormalizer:
         Returns:
             Cleaned amount string.
         """
-        # Remove extra whitespace
-        amount_str = ' '.join(amount_str.split())
-        
-        # Remove currency symbols
-        for symbol in self.CURRENCY_SYMBOLS:
-            amount_str = amount_str.replace(symbol, '')
-        
         # Remove currency codes (case-insensitive)
-        for code in self.CURRENCY_CODES:
-            amount_str = re.sub(rf'\b{code}\b', '', amount_str, flags=re.IGNORECASE)
+        amount_str = cls._CODE_RE.sub('', amount_str)
         
-        # Remove common prefixes
-        prefixes = ['total:', 'amount:', 'total amount:', 'due:', 'balance:']
-        for prefix in prefixes:
-            if amount_str.lower().startswith(prefix):
-                amount_str = amount_str[len(prefix):]
-        
-        # Keep only digits, comma, dot, and minus
-        amount_str = re.sub(r'[^\d,.\-]', '', amount_str)
+        # Keep only digits, comma, dot, and minus (this also drops any
+        # whitespace, currency symbols and labels such as "Total:")
+        amount_str = _strip_non_numeric(amount_str)
         
         return amount_str.strip()
     
-    def _handle_european_format(self, amount_str: str) -> str:
+    @staticmethod
+    def _handle_european_format(amount_str: str) -> str:
         """
         Convert European format (comma decimal) to US format (dot decimal).
         
@@ -340,24 +669,20 @@ class AmountNormalizer:
         Returns:
             Amount string in US format.
         """
-        # Count dots and commas
-        dot_count = amount_str.count('.')
-        comma_count = amount_str.count(',')
-        
-        # If comma is after the last dot, or there's a comma but no dot,
-        # comma might be the decimal separator
-        if comma_count == 1:
-            comma_pos = amount_str.rfind(',')
-            dot_pos = amount_str.rfind('.')
-            
-            # Comma is after dot - likely European format
-            if comma_pos > dot_pos:
-                # Also check if digits after comma <= 2 (typical for decimal)
-                after_comma = amount_str[comma_pos + 1:]
-                if len(after_comma) <= 2 and after_comma.isdigit():
-                    # European format: replace dot (thousand sep) and comma (decimal sep)
-                    amount_str = amount_str.replace('.', '')
-                    amount_str = amount_str.replace(',', '.')
+        # A single comma after the last dot (or with no dot) might be the
+        # decimal separator; most amounts have no comma and stop here
+        comma_pos = amount_str.rfind(',')
+        if comma_pos == -1 or amount_str.find(',') != comma_pos:
+            return amount_str
+        
+        # Comma is after dot - likely European format
+        if comma_pos > amount_str.rfind('.'):
+            # Also check if digits after comma <= 2 (typical for decimal)
+            after_comma = amount_str[comma_pos + 1:]
+            if len(after_comma) <= 2 and after_comma.isdigit():
+                # European format: replace dot (thousand sep) and comma (decimal sep)
+                amount_str = amount_str.replace('.', '')
+                amount_str = amount_str.replace(',', '.')
         
         return amount_str
     
@@ -371,14 +696,8 @@ class AmountNormalizer:
         Returns:
             Normalized amount string or None.
         """
-        # Pattern to match amounts with optional currency
-        patterns = [
-            r'[\$€£¥₹]?\s*[\d,]+\.?\d*',
-            r'[\d,]+\.?\d*\s*(?:USD|EUR|GBP|INR)?'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in self._AMOUNT_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 normalized = self.normalize(match)
                 if normalized:
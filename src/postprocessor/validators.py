@@ -9,16 +9,97 @@ This module provides validation functions for:
 Author: ML Engineering Team
 """
 
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from config import get_config
 from src.utils.logger import get_logger
 
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Numba is optional; when available, AmountValidator.validate_batch runs
+# a compiled loop instead of NumPy comparisons
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Distinct (date string, format) pairs remembered by _parse_date
+_PARSE_CACHE_SIZE = 8192
+
+# Default date format; parsed with datetime.fromisoformat when possible
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+# Any ASCII letter or digit
+_ALNUM_RE = re.compile(r'[A-Za-z0-9]')
+
+
+def _too_short(value: str) -> bool:
+    """
+    Check if a value has fewer than 2 characters once stripped.
+    
+    Same as ``len(value.strip()) < 2``, but only builds the stripped
+    copy when the value starts or ends with whitespace.
+    
+    Args:
+        value: Non-empty field value.
+        
+    Returns:
+        True if the stripped value is shorter than 2 characters.
+    """
+    if len(value) < 2:
+        return True
+    if not value[0].isspace() and not value[-1].isspace():
+        return False
+    return len(value.strip()) < 2
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_date(date_str: str, date_format: str) -> datetime:
+    """
+    Parse a date string; memoized so each string is parsed only once.
+    
+    A result is validated, then compared against its due date, so the
+    same string reaches strptime several times per invoice. Failures
+    raise and are not cached.
+    
+    YYYY-MM-DD strings in the default format are parsed by the C
+    fromisoformat, which is far cheaper than strptime; anything it
+    rejects goes to strptime so errors read the same.
+    
+    Args:
+        date_str: Date string to parse.
+        date_format: strptime format string.
+        
+    Returns:
+        Parsed datetime.
+        
+    Raises:
+        ValueError: If date_str doesn't match date_format.
+    """
+    if (
+        date_format == _ISO_DATE_FORMAT
+        and len(date_str) == 10
+        and date_str[4] == '-'
+        and date_str[7] == '-'
+    ):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    return datetime.strptime(date_str, date_format)
+
 
 class DateValidator:
     """
@@ -41,12 +122,21 @@ class DateValidator:
     MIN_YEAR = 2000
     MAX_YEAR = 2100
     
+    # Seconds a cached "now" stays valid for past/future checks
+    _NOW_TTL = 1.0
+    
     def __init__(self) -> None:
         """Initialize the date validator."""
         self.date_format = get_config(
             "postprocessing.date.output_format",
-            "%Y-%m-%d"
+            _ISO_DATE_FORMAT
         )
+        
+        # datetime.now() reused by is_future_date/is_past_date for up to
+        # _NOW_TTL seconds (monotonic timestamp of the last refresh)
+        self._now_cache: Optional[datetime] = None
+        self._now_cache_ts = 0.0
+        
         logger.debug("DateValidator initialized")
     
     def is_valid(self, date_str: str) -> bool:
@@ -77,7 +167,7 @@ class DateValidator:
         
         try:
             # Try to parse with expected format
-            parsed = datetime.strptime(date_str, self.date_format)
+            parsed = _parse_date(date_str, self.date_format)
             
             # Check year range
             if parsed.year < self.MIN_YEAR:
@@ -90,22 +180,50 @@ class DateValidator:
         except ValueError as e:
             return False, f"Invalid date format: {str(e)}"
     
-    def is_future_date(self, date_str: str) -> bool:
-        """Check if date is in the future."""
+    def is_future_date(self, date_str: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check if date is in the future.
+        
+        Args:
+            date_str: Date string to check.
+            now: Reference time; pass one value when checking many rows.
+                Defaults to the current time, refreshed once per second.
+            
+        Returns:
+            True if the date is after now.
+        """
         try:
-            parsed = datetime.strptime(date_str, self.date_format)
-            return parsed > datetime.now()
+            parsed = _parse_date(date_str, self.date_format)
+            return parsed > (now or self._now())
         except ValueError:
             return False
     
-    def is_past_date(self, date_str: str) -> bool:
-        """Check if date is in the past."""
+    def is_past_date(self, date_str: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check if date is in the past.
+        
+        Args:
+            date_str: Date string to check.
+            now: Reference time; pass one value when checking many rows.
+                Defaults to the current time, refreshed once per second.
+            
+        Returns:
+            True if the date is before now.
+        """
         try:
-            parsed = datetime.strptime(date_str, self.date_format)
-            return parsed < datetime.now()
+            parsed = _parse_date(date_str, self.date_format)
+            return parsed < (now or self._now())
         except ValueError:
             return False
     
+    def _now(self) -> datetime:
+        """Get the current time, refreshed at most once per _NOW_TTL seconds."""
+        ts = time.monotonic()
+        if self._now_cache is None or ts - self._now_cache_ts >= self._NOW_TTL:
+            self._now_cache = datetime.now()
+            self._now_cache_ts = ts
+        return self._now_cache
+    
     def is_due_after_invoice(
         self,
         invoice_date: str,
@@ -122,8 +240,8 @@ class DateValidator:
             Tuple of (is_valid, message).
         """
         try:
-            inv_parsed = datetime.strptime(invoice_date, self.date_format)
-            due_parsed = datetime.strptime(due_date, self.date_format)
+            inv_parsed = _parse_date(invoice_date, self.date_format)
+            due_parsed = _parse_date(due_date, self.date_format)
             
             if due_parsed < inv_parsed:
                 return False, "Due date is before invoice date"
@@ -134,6 +252,23 @@ class DateValidator:
             return True, "Could not validate date relationship"
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _check_amounts(values, min_amount, max_amount):
+        """Range-check a float64 array, returning (valid mask, error codes)."""
+        valid = np.empty(values.shape[0], dtype=np.bool_)
+        codes = np.empty(values.shape[0], dtype=np.int8)
+        for i in range(values.shape[0]):
+            if values[i] < min_amount:
+                codes[i] = 1
+            elif values[i] > max_amount:
+                codes[i] = 2
+            else:
+                codes[i] = 0
+            valid[i] = codes[i] == 0
+        return valid, codes
+
+
 class AmountValidator:
     """
     Validates amount/currency fields.
@@ -155,6 +290,11 @@ class AmountValidator:
     MIN_AMOUNT = 0.0
     MAX_AMOUNT = 1_000_000_000  # 1 billion
     
+    # Error codes returned by validate_batch()
+    CODE_VALID = 0
+    CODE_NEGATIVE = 1
+    CODE_TOO_LARGE = 2
+    
     def __init__(self) -> None:
         """Initialize the amount validator."""
         logger.debug("AmountValidator initialized")
@@ -199,6 +339,37 @@ class AmountValidator:
         except ValueError:
             return False, f"Could not parse amount: {amount_str}"
     
+    def validate_batch(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Range-check many already-parsed amounts at once.
+        
+        Applies the same limits as validate(). Parsing stays with the
+        caller, e.g. ``np.asarray([float(s) for s in amounts])``.
+        
+        Args:
+            values: Amounts as a float array (or anything np.asarray accepts).
+            
+        Returns:
+            Tuple of (valid mask, error codes), where each code is
+            CODE_VALID, CODE_NEGATIVE or CODE_TOO_LARGE.
+            
+        Example:
+            >>> valid, codes = validator.validate_batch(np.array([10.0, -5.0]))
+            >>> valid
+            array([ True, False])
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            return _check_amounts(values, float(self.MIN_AMOUNT), float(self.MAX_AMOUNT))
+        
+        codes = np.where(
+            values < self.MIN_AMOUNT,
+            self.CODE_NEGATIVE,
+            np.where(values > self.MAX_AMOUNT, self.CODE_TOO_LARGE, self.CODE_VALID)
+        ).astype(np.int8)
+        return codes == self.CODE_VALID, codes
+    
     def is_reasonable_total(self, amount: float) -> bool:
         """
         Check if amount is a reasonable invoice total.
@@ -213,6 +384,29 @@ class AmountValidator:
         return 10 <= amount <= 1_000_000
 
 
+# Sub-validators shared by every FieldValidator and PostProcessor; they
+# only hold configuration, so one instance per process is enough
+_date_validator: Optional[DateValidator] = None
+_amount_validator: Optional[AmountValidator] = None
+
+
+def get_shared_validators() -> Tuple[DateValidator, AmountValidator]:
+    """
+    Get the process-wide DateValidator and AmountValidator.
+    
+    They are created on first use, so building many FieldValidators
+    (e.g. one per request) doesn't repeat their config lookups.
+    
+    Returns:
+        Tuple of (DateValidator, AmountValidator).
+    """
+    global _date_validator, _amount_validator
+    if _date_validator is None:
+        _date_validator = DateValidator()
+        _amount_validator = AmountValidator()
+    return _date_validator, _amount_validator
+
+
 class FieldValidator:
     """
     General field validation for invoice data.
@@ -231,18 +425,41 @@ class FieldValidator:
     
     def __init__(self) -> None:
         """Initialize the field validator."""
-        self.required_fields = get_config(
-            "postprocessing.validation.required_fields",
-            ["invoice_number", "total_amount"]
+        # Interned so lookups against the literal field names used as
+        # dict keys elsewhere can match by identity
+        self.required_fields = tuple(
+            sys.intern(field) for field in get_config(
+                "postprocessing.validation.required_fields",
+                ["invoice_number", "total_amount"]
+            )
         )
         self.confidence_threshold = get_config(
             "postprocessing.validation.confidence_threshold",
             0.5
         )
         
-        # Initialize sub-validators
-        self.date_validator = DateValidator()
-        self.amount_validator = AmountValidator()
+        # validate_batch() settings (workers None = CPU count)
+        self.batch_workers = get_config("postprocessing.validation.batch.workers", None)
+        self.batch_chunk_size = get_config("postprocessing.validation.batch.chunk_size", 30)
+        self.batch_use_processes = get_config(
+            "postprocessing.validation.batch.use_processes",
+            False
+        )
+        
+        # Shared sub-validators
+        self.date_validator, self.amount_validator = get_shared_validators()
+        
+        # Per-field validators used by validate_field(); bound once here
+        # rather than on every call
+        self._field_dispatch = {
+            'invoice_number': self.validate_invoice_number,
+            'invoice_date': self.date_validator.validate,
+            'vendor_name': self.validate_vendor_name,
+            'customer_name': self.validate_customer_name,
+            'total_amount': self.amount_validator.validate,
+            'payment_due_date': self.date_validator.validate
+        }
+        self._known_fields = frozenset(self._field_dispatch)
         
         logger.debug(f"FieldValidator initialized (required: {self.required_fields})")
     
@@ -260,11 +477,11 @@ class FieldValidator:
             return False, "Invoice number is empty"
         
         # Invoice numbers should have at least some alphanumeric content
-        if len(value.strip()) < 2:
+        if _too_short(value):
             return False, "Invoice number too short"
         
         # Check for at least one alphanumeric character
-        if not re.search(r'[A-Za-z0-9]', value):
+        if not _ALNUM_RE.search(value):
             return False, "Invoice number must contain alphanumeric characters"
         
         return True, "Valid invoice number"
@@ -282,7 +499,7 @@ class FieldValidator:
         if not value:
             return False, "Vendor name is empty"
         
-        if len(value.strip()) < 2:
+        if _too_short(value):
             return False, "Vendor name too short"
         
         return True, "Valid vendor name"
@@ -300,7 +517,7 @@ class FieldValidator:
         if not value:
             return False, "Customer name is empty"
         
-        if len(value.strip()) < 2:
+        if _too_short(value):
             return False, "Customer name too short"
         
         return True, "Valid customer name"
@@ -320,18 +537,8 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, message).
         """
-        validators = {
-            'invoice_number': self.validate_invoice_number,
-            'invoice_date': self.date_validator.validate,
-            'vendor_name': self.validate_vendor_name,
-            'customer_name': self.validate_customer_name,
-            'total_amount': self.amount_validator.validate,
-            'payment_due_date': self.date_validator.validate
-        }
-        
-        validator = validators.get(field_name)
-        if validator:
-            return validator(value)
+        if field_name in self._known_fields:
+            return self._field_dispatch[field_name](value)
         
         # Default validation: just check not empty
         if value:
@@ -351,14 +558,91 @@ class FieldValidator:
         Returns:
             Tuple of (all_present, list of missing fields).
         """
-        missing = []
+        missing = [
+            required
+            for required in self.required_fields
+            if not (value := fields.get(required)) or str(value).isspace()
+        ]
+        
+        return not missing, missing
+    
+    def validate_batch(
+        self,
+        invoices: List[Dict[str, Any]],
+        use_processes: Optional[bool] = None
+    ) -> List['ValidationResult']:
+        """
+        Validate many invoices' fields in parallel.
+        
+        Invoices are validated independently, in chunks of
+        postprocessing.validation.batch.chunk_size, on a thread pool (or
+        a process pool, which sidesteps the GIL for large batches).
+        
+        Args:
+            invoices: One dictionary of field names to values per invoice.
+            use_processes: Use worker processes instead of threads;
+                defaults to postprocessing.validation.batch.use_processes.
+            
+        Returns:
+            One ValidationResult per invoice, in input order.
+            
+        Example:
+            >>> results = validator.validate_batch([r.fields for r in extraction_results])
+            >>> invalid = [r for r in results if not r.is_valid]
+        """
+        if not invoices:
+            return []
+        
+        if use_processes is None:
+            use_processes = self.batch_use_processes
+        
+        chunk_size = max(1, self.batch_chunk_size)
+        chunks = [
+            invoices[start:start + chunk_size]
+            for start in range(0, len(invoices), chunk_size)
+        ]
         
-        for required in self.required_fields:
-            value = fields.get(required)
-            if not value or str(value).strip() == "":
-                missing.append(required)
+        # Not worth a pool for a single chunk
+        if len(chunks) == 1:
+            return self._validate_chunk(chunks[0])
         
-        return len(missing) == 0, missing
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        workers = min(self.batch_workers or os.cpu_count() or 1, len(chunks))
+        
+        results: List['ValidationResult'] = []
+        with executor_class(max_workers=workers) as executor:
+            for chunk_results in executor.map(self._validate_chunk, chunks):
+                results.extend(chunk_results)
+        
+        logger.debug(f"Validated {len(results)} invoices in {len(chunks)} chunks")
+        return results
+    
+    def _validate_chunk(self, invoices: List[Dict[str, Any]]) -> List['ValidationResult']:
+        """Validate a chunk of invoices (runs inside a pool worker)."""
+        return [self._validate_one(fields) for fields in invoices]
+    
+    def _validate_one(self, fields: Dict[str, Any]) -> 'ValidationResult':
+        """
+        Validate the fields of one invoice.
+        
+        Args:
+            fields: Dictionary of field names to values.
+            
+        Returns:
+            ValidationResult with per-field and required-field outcomes.
+        """
+        validation = ValidationResult()
+        
+        for field_name, value in fields.items():
+            if value:
+                is_valid, message = self.validate_field(field_name, value)
+                validation.add_field_result(field_name, is_valid, message)
+        
+        _, missing = self.check_required_fields(fields)
+        for field in missing:
+            validation.add_error(f"Required field missing: {field}")
+        
+        return validation
     
     def check_confidence(
         self,
@@ -373,13 +657,14 @@ class FieldValidator:
         Returns:
             Tuple of (all_pass, list of low confidence fields).
         """
-        low_confidence = []
-        
-        for field, confidence in confidence_scores.items():
-            if confidence < self.confidence_threshold:
-                low_confidence.append(f"{field} ({confidence:.2f})")
+        threshold = self.confidence_threshold
+        low_confidence = [
+            f"{field} ({confidence:.2f})"
+            for field, confidence in confidence_scores.items()
+            if confidence < threshold
+        ]
         
-        return len(low_confidence) == 0, low_confidence
+        return not low_confidence, low_confidence
 
 
 class ValidationResult:
@@ -393,6 +678,8 @@ class ValidationResult:
         field_results: Per-field validation results
     """
     
+    __slots__ = ('is_valid', 'errors', 'warnings', 'field_results')
+    
     def __init__(self):
         self.is_valid = True
         self.errors: List[str] = []
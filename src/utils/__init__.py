@@ -7,12 +7,14 @@ This module provides common utilities used across all other modules:
     - Common helpers
 """
 
-from .logger import setup_logger, get_logger
+from .logger import setup_logger, get_logger, debug_enabled, LazyFormat
 from .helpers import ensure_directory, get_file_extension, generate_timestamp
 
 __all__ = [
     'setup_logger',
     'get_logger', 
+    'debug_enabled',
+    'LazyFormat',
     'ensure_directory',
     'get_file_extension',
     'generate_timestamp'
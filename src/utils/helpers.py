@@ -15,9 +15,16 @@ Functions:
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional
 
+# Characters not allowed in Windows filenames
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# format_file_size() units, each 1024 times the previous one
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """
@@ -64,7 +71,12 @@ def get_file_extension(filepath: Union[str, Path]) -> str:
         >>> get_file_extension("noextension")
         ""
     """
-    return Path(filepath).suffix.lower()
+    # Same rules as Path.suffix, without building a Path object
+    name = os.path.basename(os.fspath(filepath).rstrip('/' + os.sep))
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
 
 
 def generate_timestamp(format_str: str = "%Y%m%d_%H%M%S") -> str:
@@ -104,9 +116,7 @@ def safe_filename(filename: str, replacement: str = "_") -> str:
         >>> safe_filename("invoice:123/test.pdf")
         "invoice_123_test.pdf"
     """
-    # Characters not allowed in Windows filenames
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, replacement, filename)
+    sanitized = _INVALID_FILENAME_RE.sub(replacement, filename)
     
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip('. ')
@@ -134,11 +144,11 @@ def format_file_size(size_bytes: int) -> str:
         >>> format_file_size(1048576)
         "1.0 MB"
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    # The unit index is the bit length of the integer part divided by 10
+    index = 0
+    if size_bytes >= 1024:
+        index = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def validate_file_exists(filepath: Union[str, Path]) -> bool:
@@ -159,12 +169,14 @@ def validate_file_exists(filepath: Union[str, Path]) -> bool:
     return path.exists() and path.is_file()
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the project root directory.
     
     Traverses up from the current file location to find the project root,
-    identified by the presence of key files/directories.
+    identified by the presence of key files/directories. The location is
+    fixed for the process, so the lookup runs once and is cached.
     
     Returns:
         Path to project root directory.
@@ -200,10 +212,18 @@ def merge_dicts(base: dict, override: dict) -> dict:
     """
     result = base.copy()
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # Walk the nested levels with a worklist instead of recursing; only
+    # levels present in both dicts are copied, so base is never mutated
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
     
     return result
@@ -14,25 +14,83 @@ Usage:
     # Get logger in any module
     logger = get_logger(__name__)
     logger.info("Processing invoice...")
+    
+    # Pass values as %-style arguments; they are only formatted when the
+    # record is actually emitted
+    logger.debug("Extracted %d fields from %s", len(fields), path)
+    
+    # Build expensive debug payloads only when DEBUG is on
+    if debug_enabled(logger):
+        logger.debug("Tokens: %s", describe_tokens(tokens))
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
-from pathlib import Path
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Optional, TextIO
 
-# Try to import colorama for colored console output
-try:
-    import colorama
-    from colorama import Fore, Style
-    colorama.init()
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
+# Source file logging uses to skip its own frames in findCaller();
+# setting logging._srcfile to None disables the stack walk entirely
+_LOGGING_SRCFILE = logging._srcfile
+
+# Format fields that need findCaller()
+_CALLER_FIELDS = ("%(pathname", "%(filename", "%(module", "%(funcName", "%(lineno")
+
+# Background writer started by setup_logger(background=True)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Application logger name and the prefix of its children
+_ROOT_NAME = "invoice_extraction"
+_ROOT_PREFIX = _ROOT_NAME + "."
+
+# Write buffer size for FastRotatingFileHandler
+_FILE_BUFFER_SIZE = 65536
+
+# Default record layout; FastFormatter renders exactly this format
+_DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats the timestamp once per second.
+    
+    Records logged within the same second share the strftime() result;
+    milliseconds are still added per record when no datefmt is set.
+    """
+    
+    # (second, datefmt, text) of the last timestamp; replaced as a whole
+    # so threads never see a mismatched pair
+    _time_cache = (None, None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Return the creation time of a record as a string.
+        
+        Args:
+            record: Log record.
+            datefmt: strftime() format; defaults to default_time_format
+                plus milliseconds.
+            
+        Returns:
+            Formatted timestamp.
+        """
+        second = int(record.created)
+        cached_second, cached_format, text = self._time_cache
+        if second != cached_second or datefmt != cached_format:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, datefmt, text)
+        
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
 
 
-class ColoredFormatter(logging.Formatter):
+class ColoredFormatter(CachedTimeFormatter):
     """
     Custom formatter that adds color to console log output.
     
@@ -44,16 +102,46 @@ class ColoredFormatter(logging.Formatter):
         - CRITICAL: Red (bold)
     """
     
-    COLORS = {
-        logging.DEBUG: Fore.CYAN if COLORAMA_AVAILABLE else '',
-        logging.INFO: Fore.GREEN if COLORAMA_AVAILABLE else '',
-        logging.WARNING: Fore.YELLOW if COLORAMA_AVAILABLE else '',
-        logging.ERROR: Fore.RED if COLORAMA_AVAILABLE else '',
-        logging.CRITICAL: Fore.RED + Style.BRIGHT if COLORAMA_AVAILABLE else '',
-    }
-    RESET = Style.RESET_ALL if COLORAMA_AVAILABLE else ''
+    def __init__(self, *args, stream: Optional[TextIO] = None, **kwargs) -> None:
+        """
+        Initialize the formatter.
+        
+        The color codes are baked into one format style per level here,
+        so formatting a record needs no extra string concatenation.
+        Without colorama installed the output is left uncolored.
+        
+        Args:
+            *args: Positional arguments for logging.Formatter.
+            stream: Destination stream; output is left uncolored when it
+                is not a terminal.
+            **kwargs: Keyword arguments for logging.Formatter.
+        """
+        super().__init__(*args, **kwargs)
+        
+        try:
+            from colorama import Fore, Style
+            self.COLORS = {
+                logging.DEBUG: Fore.CYAN,
+                logging.INFO: Fore.GREEN,
+                logging.WARNING: Fore.YELLOW,
+                logging.ERROR: Fore.RED,
+                logging.CRITICAL: Fore.RED + Style.BRIGHT,
+            }
+            self.RESET = Style.RESET_ALL
+        except ImportError:
+            self.COLORS = {}
+            self.RESET = ''
+        
+        # No per-level styles means formatMessage() uses the plain one
+        self._level_styles = {}
+        if stream is None or stream.isatty():
+            style_class = type(self._style)
+            self._level_styles = {
+                level: style_class(color + self._style._fmt + self.RESET)
+                for level, color in self.COLORS.items()
+            }
     
-    def format(self, record: logging.LogRecord) -> str:
+    def formatMessage(self, record: logging.LogRecord) -> str:
         """
         Format log record with color codes.
         
@@ -63,9 +151,157 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log string with color codes.
         """
-        color = self.COLORS.get(record.levelno, '')
-        message = super().format(record)
-        return f"{color}{message}{self.RESET}"
+        return self._level_styles.get(record.levelno, self._style).format(record)
+
+
+class FastFormatter(CachedTimeFormatter):
+    """
+    Formatter hard-wired to the default record layout.
+    
+    Produces the same output as logging.Formatter(_DEFAULT_FORMAT), but
+    builds the line with one f-string instead of %-interpolating the
+    format against the record's __dict__, and only once per record.
+    """
+    
+    def __init__(self, datefmt: Optional[str] = None) -> None:
+        """
+        Initialize the formatter.
+        
+        Args:
+            datefmt: Date format for the timestamp.
+        """
+        super().__init__(_DEFAULT_FORMAT, datefmt=datefmt)
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record, including any exception and stack information.
+        
+        Args:
+            record: Log record to format.
+            
+        Returns:
+            Formatted log line.
+        """
+        # setup_logger() gives the console and file handlers the same
+        # instance when colors are off, so reuse the line built for the
+        # first handler
+        cached = record.__dict__.get('_fast_format')
+        if cached is not None and cached[0] == id(self):
+            return cached[1]
+        
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = f"{record.asctime} | {record.levelname:<8} | {record.name} | {record.message}"
+        
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        
+        record._fast_format = (id(self), s)
+        return s
+
+
+@lru_cache(maxsize=1)
+def _init_colorama() -> bool:
+    """
+    Import and initialize colorama on first use.
+    
+    Returns:
+        True if colorama is installed, False otherwise.
+    """
+    try:
+        import colorama
+    except ImportError:
+        return False
+    colorama.init()
+    return True
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotating file handler that writes encoded bytes to a buffered
+    binary stream.
+    
+    Compared with RotatingFileHandler it formats each record once,
+    skips the text encoding layer and the per-record flush, and checks
+    whether the file is a regular file only when opening it. The buffer
+    is flushed for records at flush_level or above and on close.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        mode: str = 'a',
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str = 'utf-8',
+        delay: bool = False,
+        errors: Optional[str] = None,
+        flush_level: int = logging.ERROR
+    ) -> None:
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Log file path.
+            mode: File mode ('a' or 'w'); opened in binary.
+            maxBytes: Size that triggers a rollover (0 = never).
+            backupCount: Number of rotated files to keep.
+            encoding: Encoding of the written records.
+            delay: Open the file on the first record instead of now.
+            errors: Encoding error handling.
+            flush_level: Records at this level or above are flushed to
+                the file immediately.
+        """
+        self.flush_level = flush_level
+        self._rotatable = True
+        super().__init__(
+            filename, mode, maxBytes, backupCount,
+            encoding=encoding, delay=delay, errors=errors
+        )
+    
+    def _open(self):
+        """Open the log file in buffered binary mode."""
+        stream = open(self.baseFilename, self.mode + 'b', buffering=_FILE_BUFFER_SIZE)
+        # Never roll over anything other than regular files (bpo-45401)
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record, rolling the file over first if it would grow
+        past maxBytes.
+        
+        Args:
+            record: Log record to write.
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(
+                self.encoding, self.errors or 'strict'
+            )
+            if self.stream is None:
+                if self.mode == 'w' and self._closed:
+                    return
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._rotatable and \
+                    self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logger(
@@ -75,7 +311,11 @@ def setup_logger(
     log_file: Optional[str] = None,
     max_bytes: int = 10485760,  # 10 MB
     backup_count: int = 5,
-    colorize: bool = True
+    colorize: bool = True,
+    capture_caller: bool = False,
+    buffer_capacity: int = 512,
+    flush_level: str = "ERROR",
+    background: bool = True
 ) -> logging.Logger:
     """
     Configure the root logger for the invoice extraction system.
@@ -88,10 +328,18 @@ def setup_logger(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         log_format: Custom log format string.
         date_format: Custom date format string.
-        log_file: Path to log file. If None, file logging is disabled.
+        log_file: Path to log file. If None, os.devnull or "-", file
+            logging is disabled.
         max_bytes: Maximum log file size before rotation.
         backup_count: Number of backup files to keep.
         colorize: Whether to colorize console output.
+        capture_caller: Look up the calling file, line and function for
+            every record. Always on when log_format uses those fields.
+        buffer_capacity: File records held in memory before one write
+            (0 writes every record immediately).
+        flush_level: Level that forces buffered file records out at once.
+        background: Format and write records on a listener thread, so
+            logging calls only enqueue the record.
         
     Returns:
         Configured root logger.
@@ -101,56 +349,131 @@ def setup_logger(
     """
     # Default formats
     if log_format is None:
-        log_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+        log_format = _DEFAULT_FORMAT
     if date_format is None:
         date_format = "%Y-%m-%d %H:%M:%S"
     
     # Get root logger for our application
-    root_logger = logging.getLogger("invoice_extraction")
-    root_logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    root_logger = logging.getLogger(_ROOT_NAME)
+    root_logger.setLevel(log_level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates; closing them writes
+    # out anything still buffered
+    _stop_listener()
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers.clear()
+    handlers = []
     
     # Console handler
+    # Colors only for a terminal; colorama is set up before the handler
+    # picks up sys.stdout, since on Windows init() wraps it
+    use_color = colorize and sys.stdout.isatty() and _init_colorama()
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(log_level)
     
-    if colorize and COLORAMA_AVAILABLE:
-        console_formatter = ColoredFormatter(log_format, datefmt=date_format)
+    # Plain formatter shared by the file handler and uncolored console
+    if log_format == _DEFAULT_FORMAT:
+        formatter = FastFormatter(datefmt=date_format)
+    else:
+        formatter = CachedTimeFormatter(log_format, datefmt=date_format)
+    if use_color:
+        console_formatter = ColoredFormatter(
+            log_format, datefmt=date_format, stream=sys.stdout
+        )
     else:
-        console_formatter = logging.Formatter(log_format, datefmt=date_format)
+        console_formatter = formatter
     
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
-    # File handler (if log file specified)
+    # File handler (if log file specified); don't format records just
+    # to throw them away
+    if log_file in (os.devnull, "-"):
+        log_file = None
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_path,
+        # delay: the file is only opened once the first record is written
+        # Without the MemoryHandler every record is flushed, as before
+        flush_level_value = getattr(logging, flush_level.upper())
+        file_handler = FastRotatingFileHandler(
+            log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True,
+            flush_level=flush_level_value if buffer_capacity > 0 else logging.NOTSET
         )
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_formatter = logging.Formatter(log_format, datefmt=date_format)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
+        
+        # Batch file writes; logging.shutdown() at exit flushes the rest
+        if buffer_capacity > 0:
+            handlers.append(logging.handlers.MemoryHandler(
+                buffer_capacity,
+                flushLevel=flush_level_value,
+                target=file_handler,
+                flushOnClose=True
+            ))
+        else:
+            handlers.append(file_handler)
+    
+    global _listener
+    if background:
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     # Prevent propagation to root logger
     root_logger.propagate = False
     
+    # LogRecord looks up the thread and process for every record; skip
+    # that unless the format actually shows them
+    logging.logThreads = "%(thread" in log_format
+    logging.logProcesses = logging.logMultiprocessing = "%(process" in log_format
+    
+    # Same for the caller lookup, which walks the stack on every record
+    if capture_caller or any(field in log_format for field in _CALLER_FIELDS):
+        logging._srcfile = _LOGGING_SRCFILE
+    else:
+        logging._srcfile = None
+    
     root_logger.info("Logging initialized successfully")
     return root_logger
 
 
+def _stop_listener() -> None:
+    """Drain and stop the background writer, closing its handlers."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Registered after logging's own shutdown hook, so it runs first and the
+# queue is drained before the handlers are flushed
+atexit.register(_stop_listener)
+
+
+@lru_cache(maxsize=1024)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
     
+    Results are memoized per name, so repeated calls skip the logging
+    manager's lock.
+    
     Args:
         name: Name for the logger, typically __name__.
         
@@ -162,9 +485,60 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger.info("Processing started")
     """
     # Create child logger under our application namespace
-    if name.startswith("invoice_extraction"):
+    if name == _ROOT_NAME or name.startswith(_ROOT_PREFIX):
         return logging.getLogger(name)
-    return logging.getLogger(f"invoice_extraction.{name}")
+    return logging.getLogger(sys.intern(_ROOT_PREFIX + name))
+
+
+def debug_enabled(logger: logging.Logger) -> bool:
+    """
+    Check whether a logger would emit DEBUG records.
+    
+    Use it to skip building expensive debug payloads that would be
+    thrown away.
+    
+    Args:
+        logger: Logger to check.
+        
+    Returns:
+        True if DEBUG records are enabled, False otherwise.
+        
+    Example:
+        >>> if debug_enabled(logger):
+        ...     logger.debug("Tokens: %s", describe_tokens(tokens))
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+class LazyFormat:
+    """
+    Defer building a log message argument until it is rendered.
+    
+    The wrapped callable only runs when a handler formats the record,
+    so it costs nothing for records below the logger's level.
+    
+    Example:
+        >>> logger.debug("Fields: %s", LazyFormat(json.dumps, fields, indent=2))
+    """
+    
+    __slots__ = ('fn', 'args', 'kwargs')
+    
+    def __init__(self, fn, *args, **kwargs) -> None:
+        """
+        Initialize the wrapper.
+        
+        Args:
+            fn: Callable that builds the string.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+        """
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+    
+    def __str__(self) -> str:
+        """Call the wrapped function and return its result as a string."""
+        return str(self.fn(*self.args, **self.kwargs))
 
 
 # Convenience function to initialize logging from config
@@ -178,17 +552,26 @@ def setup_logger_from_config() -> logging.Logger:
     try:
         from config import get_config
         
-        level = get_config("logging.level", "INFO")
-        log_format = get_config("logging.format")
-        date_format = get_config("logging.date_format")
+        # Look up the logging section once and read the keys locally
+        log_config = get_config("logging", {}) or {}
+        file_config = log_config.get("file") or {}
+        console_config = log_config.get("console") or {}
+        
+        level = log_config.get("level", "INFO")
+        log_format = log_config.get("format")
+        date_format = log_config.get("date_format")
         
         log_file = None
-        if get_config("logging.file.enabled", False):
-            log_file = get_config("logging.file.path")
+        if file_config.get("enabled", False):
+            log_file = file_config.get("path")
         
-        max_bytes = get_config("logging.file.max_bytes", 10485760)
-        backup_count = get_config("logging.file.backup_count", 5)
-        colorize = get_config("logging.console.colorize", True)
+        max_bytes = file_config.get("max_bytes", 10485760)
+        backup_count = file_config.get("backup_count", 5)
+        colorize = console_config.get("colorize", True)
+        buffer_capacity = file_config.get("buffer_capacity", 512)
+        flush_level = file_config.get("flush_level", "ERROR")
+        background = log_config.get("background", True)
+        capture_caller = log_config.get("capture_caller", False)
         
         return setup_logger(
             level=level,
@@ -197,9 +580,14 @@ def setup_logger_from_config() -> logging.Logger:
             log_file=log_file,
             max_bytes=max_bytes,
             backup_count=backup_count,
-            colorize=colorize
+            colorize=colorize,
+            capture_caller=capture_caller,
+            buffer_capacity=buffer_capacity,
+            flush_level=flush_level,
+            background=background
         )
     except Exception as e:
         # Fallback to default configuration
-        print(f"Warning: Could not load logging config, using defaults: {e}")
-        return setup_logger()
+        root_logger = setup_logger()
+        root_logger.warning("Could not load logging config, using defaults: %s", e)
+        return root_logger